@@ -13,6 +13,21 @@ except ImportError:
     GPIO_AVAILABLE = False
     logging.warning("RPi.GPIO 不可用，蜂鳴器將以模擬模式運行")
 
+# 具名音效 (頻率Hz, 持續時間秒)，可直接傳給 play_tone
+TONE_PRESETS = {
+    "navigate": (600, 0.05),
+    "select": (800, 0.1),
+    "back": (400, 0.1),
+    "game_start": (1000, 0.3),
+    "score": (1200, 0.1),
+    "level_up": (1000, 0.2),
+    "error": (200, 0.3),
+    "game_over": (300, 0.5),
+}
+
+# 音樂佇列上限，超過時丟棄新音效，避免音效延遲反壓主循環
+MUSIC_QUEUE_SIZE = 8
+
 class BuzzerControl:
     """蜂鳴器控制類"""
     
@@ -22,7 +37,7 @@ class BuzzerControl:
         self.volume = 0.8  # 音量控制 (0.0 - 1.0)
         
         # 音樂佇列和播放控制
-        self.music_queue = queue.Queue()
+        self.music_queue = queue.Queue(maxsize=MUSIC_QUEUE_SIZE)
         self.is_playing = False
         self.stop_current = threading.Event()
         
@@ -129,10 +144,23 @@ class BuzzerControl:
                 time.sleep(item['duration'])
     
     def play_tone(self, frequency=800, duration=0.5):
-        """播放單一音調"""
+        """
+        播放單一音調（非阻塞，由工作線程播放）
+        
+        參數:
+            frequency: 頻率 (Hz)，或 TONE_PRESETS 中的音效名稱
+            duration: 持續時間 (秒)，使用音效名稱時忽略
+        """
         if not self.enabled:
             return
         
+        if isinstance(frequency, str):
+            preset = TONE_PRESETS.get(frequency)
+            if preset is None:
+                logging.warning(f"未知的音效名稱: {frequency}")
+                return
+            frequency, duration = preset
+        
         task = {
             'type': 'tone',
             'frequency': frequency,
@@ -73,6 +73,14 @@ class XboxController:
         # 用於控制輸入處理頻率
         self.last_update_time = time.time()
         self.update_interval = 0.01  # 10ms
+        
+        # 未連接時重新偵測控制器的間隔（重新初始化 joystick 模組成本高）
+        self.reconnect_interval = 1.0
+        self.last_reconnect_time = 0
+        
+        # 是否在 get_input 中自行抽取 pygame 事件
+        # 主程式每幀已統一呼叫 pygame.event.get() 時可設為 False
+        self.auto_pump = True
     
     def initialize_controller(self):
         """初始化可用的 Xbox 控制器"""
@@ -140,14 +148,18 @@ class XboxController:
         
         self.last_update_time = current_time
         
-        # 如果控制器未連接，嘗試重新連接
+        # 如果控制器未連接，每隔 reconnect_interval 嘗試重新連接一次
         if not self.is_connected:
+            if current_time - self.last_reconnect_time < self.reconnect_interval:
+                return self.last_input
+            self.last_reconnect_time = current_time
             self.check_connection()
             if not self.is_connected:
                 return self.last_input
         
         # 處理 pygame 事件
-        self._process_events()
+        if self.auto_pump:
+            self._process_events()
         
         try:
             # 讀取搖桿位置
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# font_cache.py - 全程序共用的 Pygame 字型快取
+
+import pygame
+
+# {字型大小: pygame.font.Font}，所有畫面與遊戲共用同一份字型與字形快取
+_FONT_CACHE = {}
+
+
+def get_font(size):
+    """
+    取得指定大小的預設字型，同一大小只建立一次
+
+    參數:
+        size: 字型大小
+
+    返回:
+        pygame.font.Font 物件
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        if not pygame.font.get_init():
+            # 字型模組曾被關閉時，舊的字型物件已失效
+            _FONT_CACHE.clear()
+            pygame.font.init()
+        font = pygame.font.Font(None, size)
+        _FONT_CACHE[size] = font
+    return font
@@ -7,6 +7,7 @@ import pygame
 import time
 import math
 from pygame.locals import *
+from font_cache import get_font
 
 class EnhancedSnakeGame:
     """增強版貪吃蛇遊戲類"""
@@ -450,7 +451,7 @@ class EnhancedSnakeGame:
                 screen.blit(particle_surf, (particle['x'] - size, particle['y'] - size))
         
         # 繪製UI
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         
         # 基本信息
         score_text = font.render(f"分數: {self.score}", True, self.WHITE)
@@ -469,7 +470,7 @@ class EnhancedSnakeGame:
         
         # 道具狀態顯示
         y_offset = 130
-        font_small = pygame.font.Font(None, 24)
+        font_small = get_font(24)
         
         powerup_names = {
             'invincible': '無敵',
@@ -497,9 +498,9 @@ class EnhancedSnakeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
-        font = pygame.font.Font(None, 36)
+        font_large = get_font(72)
+        font_medium = get_font(48)
+        font = get_font(36)
         
         # 標題
         text = font_large.render("遊戲結束", True, self.RED)
@@ -528,11 +529,11 @@ class EnhancedSnakeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("暫停", True, self.YELLOW)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         continue_text = font.render("按 Start 繼續", True, self.WHITE)
         screen.blit(continue_text, (self.width // 2 - continue_text.get_width() // 2, 
                                   self.height // 2 + 10))
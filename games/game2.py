@@ -7,6 +7,7 @@ import pygame
 import time
 import math
 from pygame.locals import *
+from font_cache import get_font
 
 class BrickBreakerGame:
     """打磚塊遊戲類"""
@@ -307,7 +308,7 @@ class BrickBreakerGame:
             pygame.draw.rect(screen, brick['color'], brick['rect'])
         
         # 繪製分數和生命值
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         score_text = font.render(f"分數: {self.score}", True, self.WHITE)
         lives_text = font.render(f"生命: {self.lives}", True, self.WHITE)
         
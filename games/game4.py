@@ -6,6 +6,7 @@ import random
 import pygame
 import time
 from pygame.locals import *
+from font_cache import get_font
 
 class TicTacToeGame:
     """井字遊戲類"""
@@ -291,7 +292,7 @@ class TicTacToeGame:
             pygame.draw.rect(screen, self.YELLOW, cursor_rect, 5)
         
         # 繪製遊戲資訊
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         
         # 顯示當前玩家
         if not self.game_over and not self.paused:
@@ -321,7 +322,7 @@ class TicTacToeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         
         if self.winner == 0:
             result_text = "平局！"
@@ -337,7 +338,7 @@ class TicTacToeGame:
         text = font.render(result_text, True, color)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         restart_text = font.render("按 Start 重新開始", True, self.WHITE)
         screen.blit(restart_text, (self.width // 2 - restart_text.get_width() // 2, self.height // 2 + 20))
     
@@ -347,7 +348,7 @@ class TicTacToeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("暫停", True, self.YELLOW)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
 
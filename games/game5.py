@@ -7,6 +7,7 @@ import pygame
 import time
 import math
 from pygame.locals import *
+from font_cache import get_font
 
 class MemoryMatchGame:
     """記憶翻牌遊戲類"""
@@ -276,7 +277,7 @@ class MemoryMatchGame:
         show_all = current_time - self.show_all_start < self.show_all_time
         
         # 繪製標題
-        font_large = pygame.font.Font(None, 48)
+        font_large = get_font(48)
         title_text = font_large.render("記憶翻牌", True, self.WHITE)
         screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, 20))
         
@@ -318,7 +319,7 @@ class MemoryMatchGame:
                 screen.blit(particle_surf, (particle['x'] - size, particle['y'] - size))
         
         # 繪製遊戲資訊
-        font_medium = pygame.font.Font(None, 36)
+        font_medium = get_font(36)
         
         # 分數和統計
         info_y = self.height - 80
@@ -341,7 +342,7 @@ class MemoryMatchGame:
         if show_all:
             countdown = int(self.show_all_time - (current_time - self.show_all_start))
             if countdown > 0:
-                font_countdown = pygame.font.Font(None, 72)
+                font_countdown = get_font(72)
                 countdown_text = font_countdown.render(f"記住位置: {countdown}", True, self.YELLOW)
                 screen.blit(countdown_text, (self.width // 2 - countdown_text.get_width() // 2, self.height // 2 - 50))
         
@@ -357,8 +358,8 @@ class MemoryMatchGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
+        font_large = get_font(72)
+        font_medium = get_font(48)
         
         # 標題
         title_text = font_large.render("恭喜完成！", True, self.GREEN)
@@ -389,11 +390,11 @@ class MemoryMatchGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font_large = pygame.font.Font(None, 72)
+        font_large = get_font(72)
         pause_text = font_large.render("暫停", True, self.YELLOW)
         screen.blit(pause_text, (self.width // 2 - pause_text.get_width() // 2, self.height // 2 - 50))
         
-        font_medium = pygame.font.Font(None, 36)
+        font_medium = get_font(36)
         continue_text = font_medium.render("按 Start 繼續", True, self.WHITE)
         screen.blit(continue_text, (self.width // 2 - continue_text.get_width() // 2, self.height // 2 + 10))
     
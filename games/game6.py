@@ -6,6 +6,7 @@ import random
 import pygame
 import time
 from pygame.locals import *
+from font_cache import get_font
 
 class SimpleMazeGame:
     """簡易迷宮遊戲類"""
@@ -271,7 +272,7 @@ class SimpleMazeGame:
         pygame.draw.rect(screen, self.PLAYER_COLOR, player_rect)
         
         # 繪製遊戲資訊
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         
         # 等級信息
         level_text = font.render(f"等級: {self.level}", True, self.WHITE)
@@ -300,11 +301,11 @@ class SimpleMazeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("遊戲結束", True, self.RED)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         level_text = font.render(f"達成等級: {self.level}", True, self.WHITE)
         screen.blit(level_text, (self.width // 2 - level_text.get_width() // 2, self.height // 2 + 10))
         
@@ -320,11 +321,11 @@ class SimpleMazeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("暫停", True, self.YELLOW)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         continue_text = font.render("按 Start 繼續", True, self.WHITE)
         screen.blit(continue_text, (self.width // 2 - continue_text.get_width() // 2, self.height // 2 + 10))
     
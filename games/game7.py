@@ -6,6 +6,7 @@ import random
 import pygame
 import time
 from pygame.locals import *
+from font_cache import get_font
 
 class WhacAMoleGame:
     """打地鼠遊戲類"""
@@ -314,7 +315,7 @@ class WhacAMoleGame:
                          5)
         
         # 繪製遊戲資訊
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         
         # 分數
         score_text = font.render(f"分數: {self.score}", True, self.WHITE)
@@ -342,11 +343,11 @@ class WhacAMoleGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("遊戲結束", True, self.RED)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         score_text = font.render(f"最終分數: {self.score}", True, self.WHITE)
         screen.blit(score_text, (self.width // 2 - score_text.get_width() // 2, self.height // 2 + 10))
         
@@ -362,11 +363,11 @@ class WhacAMoleGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("暫停", True, self.YELLOW)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         continue_text = font.render("按 Start 繼續", True, self.WHITE)
         screen.blit(continue_text, (self.width // 2 - continue_text.get_width() // 2, self.height // 2 + 10))
     
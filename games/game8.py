@@ -6,6 +6,7 @@ import random
 import pygame
 import time
 from pygame.locals import *
+from font_cache import get_font
 
 class TetrisLikeGame:
     """俄羅斯方塊遊戲類"""
@@ -122,6 +123,7 @@ class TetrisLikeGame:
         
         # 當前下落的方塊
         self.current_shape = None
+        self.current_cells = ()  # 當前方塊中非空格子的 (x, y) 偏移
         self.current_color = None
         self.current_x = 0
         self.current_y = 0
@@ -145,7 +147,7 @@ class TetrisLikeGame:
         """生成一個新的隨機方塊"""
         # 選擇隨機形狀和顏色
         shape_idx = random.randint(0, len(self.SHAPES) - 1)
-        self.current_shape = self.SHAPES[shape_idx]
+        self.set_current_shape(self.SHAPES[shape_idx])
         self.current_color = shape_idx + 1  # 顏色索引從 1 開始，0 表示空白
         
         # 設置初始位置 (居中)
@@ -159,6 +161,13 @@ class TetrisLikeGame:
             if self.buzzer:
                 self.buzzer.play_game_over_melody()
     
+    def set_current_shape(self, shape):
+        """設定當前方塊，並預先計算其非空格子"""
+        self.current_shape = shape
+        self.current_cells = tuple(
+            (x, y) for y in range(4) for x in range(4) if shape[y][x] != 0
+        )
+    
     def rotate_shape(self, shape):
         """旋轉方塊 (順時針旋轉90度)"""
         # 轉置矩陣
@@ -171,22 +180,25 @@ class TetrisLikeGame:
     
     def is_collision(self):
         """檢查當前方塊是否與邊界或其他方塊碰撞"""
-        for y in range(4):
-            for x in range(4):
-                if self.current_shape[y][x] == 0:
-                    continue
-                    
-                board_x = self.current_x + x
-                board_y = self.current_y + y
-                
-                # 檢查是否超出邊界
-                if (board_x < 0 or board_x >= self.grid_width or
-                    board_y < 0 or board_y >= self.grid_height):
-                    return True
-                
-                # 檢查是否與已有方塊重疊
-                if board_y >= 0 and self.board[board_y][board_x] > 0:
-                    return True
+        board = self.board
+        grid_width = self.grid_width
+        grid_height = self.grid_height
+        cur_x = self.current_x
+        cur_y = self.current_y
+        
+        # 只檢查方塊實際佔用的格子
+        for x, y in self.current_cells:
+            board_x = cur_x + x
+            board_y = cur_y + y
+            
+            # 檢查是否超出邊界
+            if (board_x < 0 or board_x >= grid_width or
+                board_y < 0 or board_y >= grid_height):
+                return True
+            
+            # 檢查是否與已有方塊重疊
+            if board[board_y][board_x] > 0:
+                return True
                     
         return False
     
@@ -224,7 +236,7 @@ class TetrisLikeGame:
     def rotate(self):
         """嘗試旋轉當前方塊"""
         original_shape = self.current_shape
-        self.current_shape = self.rotate_shape(self.current_shape)
+        self.set_current_shape(self.rotate_shape(self.current_shape))
         
         # 如果旋轉後碰撞，嘗試左右移動調整位置
         if self.is_collision():
@@ -236,7 +248,7 @@ class TetrisLikeGame:
                 if self.is_collision():
                     # 如果仍然無法旋轉，恢復原始形狀和位置
                     self.current_x -= 1
-                    self.current_shape = original_shape
+                    self.set_current_shape(original_shape)
                     return False
         
         if self.buzzer:
@@ -276,8 +288,8 @@ class TetrisLikeGame:
         lines_to_clear = []
         
         # 檢查哪些行已滿
-        for y in range(self.grid_height):
-            if all(self.board[y][x] > 0 for x in range(self.grid_width)):
+        for y, row in enumerate(self.board):
+            if 0 not in row:
                 lines_to_clear.append(y)
         
         # 清除行
@@ -489,7 +501,7 @@ class TetrisLikeGame:
                         pygame.draw.rect(screen, self.WHITE, block_rect, 1)
         
         # 繪製遊戲資訊
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         
         # 分數
         score_text = font.render(f"分數: {self.score}", True, self.WHITE)
@@ -517,11 +529,11 @@ class TetrisLikeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("遊戲結束", True, self.RED)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         score_text = font.render(f"最終分數: {self.score}", True, self.WHITE)
         screen.blit(score_text, (self.width // 2 - score_text.get_width() // 2, self.height // 2 + 10))
         
@@ -537,11 +549,11 @@ class TetrisLikeGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("暫停", True, self.YELLOW)
         screen.blit(text, (self.width // 2 - text.get_width() // 2, self.height // 2 - 50))
         
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         continue_text = font.render("按 Start 繼續", True, self.WHITE)
         screen.blit(continue_text, (self.width // 2 - continue_text.get_width() // 2, self.height // 2 + 10))
     
@@ -6,11 +6,42 @@ import random
 import pygame
 import time
 import math
+import statistics
 from pygame.locals import *
+from font_cache import get_font
+
+# NumPy 只在第一次產生粒子時才載入，避免拖慢樹莓派啟動
+_np = None
+_np_rng = None
+_np_checked = False
+
+def _ensure_np():
+    """延遲載入 NumPy，不可用時返回 None"""
+    global _np, _np_rng, _np_checked
+    if not _np_checked:
+        _np_checked = True
+        try:
+            import numpy
+            _np = numpy
+            _np_rng = numpy.random.default_rng()
+        except ImportError:
+            _np = None
+    return _np
+
+def _uniform32(low, high, size):
+    """以 float32 產生一批均勻分佈隨機數（需先呼叫 _ensure_np）"""
+    return _np_rng.random(size, dtype=_np.float32) * (high - low) + low
 
 class ReactionTestGame:
     """增強版反應力測試遊戲類"""
     
+    # 正弦查表（256 等分），取代渲染時的 math.sin 呼叫
+    _SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+    _SIN_LUT_SCALE = 256 / (2 * math.pi)
+    
+    # 畫面在兩幀之間基本不變的狀態，可使用靜態背景 + 髒矩形更新
+    _STATIC_STATES = ('menu', 'instructions', 'waiting', 'result', 'game_over')
+    
     def __init__(self, width=800, height=600, buzzer=None):
         self.width = width       # 遊戲區域寬度
         self.height = height     # 遊戲區域高度
@@ -75,9 +106,33 @@ class ReactionTestGame:
             }
         ]
         
+        # 選單逐幀使用的欄位，預先攤平成平行 tuple
+        self._mode_names = tuple(m['name'] for m in self.test_modes)
+        self._mode_descriptions = tuple(m['description'] for m in self.test_modes)
+        
+        # 粒子圖快取 {(color, size, alpha_level): Surface}
+        self._particle_sprites = {}
+        
         # 初始化遊戲狀態
         self.reset_game()
     
+    def preload(self):
+        """預先載入耗時資源（可在背景線程呼叫，不觸及顯示）"""
+        _ensure_np()
+    
+    def warmup(self):
+        """預先建立所有可能用到的粒子圖，避免第一次粒子效果時卡頓（在主線程呼叫）"""
+        colors = {self.YELLOW}
+        for mode in self.test_modes:
+            colors.add(mode['signal_color'])
+            colors.update(mode.get('distractor_colors', ()))
+        
+        # 信號粒子最大 8、成功粒子最大 6 * 1.5 = 9
+        for color in colors:
+            for size in range(1, 10):
+                for alpha_level in range(8):
+                    self._get_particle_sprite(color, size, alpha_level)
+    
     def reset_game(self):
         """重置遊戲狀態"""
         # 遊戲狀態
@@ -96,6 +151,7 @@ class ReactionTestGame:
         self.state = 'menu'  # menu, instructions, waiting, signal, result, game_over
         self.signal_start_time = 0
         self.wait_start_time = 0
+        self._next_transition_ms = 0  # 下一次狀態轉換的時間點 (pygame ticks)
         self.signal_position = (self.width // 2, self.height // 2)
         self.current_signal_color = self.GREEN
         self.is_distractor = False
@@ -111,6 +167,29 @@ class ReactionTestGame:
         
         # 統計分析
         self.session_start_time = time.time()
+        
+        # 髒矩形渲染
+        self._static_bg = None       # 靜態畫面快照
+        self._static_key = None      # 快照對應的畫面內容
+        self._prev_dynamic_rects = []
+        self._dirty_rects = None     # None 表示需要整個畫面更新
+    
+    def _invalidate_static_bg(self):
+        """使靜態背景快照失效，下一幀會完整重繪"""
+        self._static_bg = None
+    
+    def invalidate_render(self):
+        """畫面被外部覆蓋時呼叫，下一幀會完整重繪"""
+        self._invalidate_static_bg()
+    
+    def get_dirty_rects(self):
+        """
+        獲取上一次 render 更新過的區域
+        
+        返回:
+            Rect 列表；若為 None 表示整個畫面都需要更新
+        """
+        return self._dirty_rects
     
     def get_current_mode(self):
         """獲取當前測試模式"""
@@ -119,6 +198,7 @@ class ReactionTestGame:
     def start_test(self):
         """開始測試"""
         self.state = 'instructions'
+        self._invalidate_static_bg()
         if self.buzzer:
             self.buzzer.play_tone(frequency=800, duration=0.3)
     
@@ -130,6 +210,7 @@ class ReactionTestGame:
         
         self.state = 'waiting'
         self.wait_start_time = time.time()
+        self._invalidate_static_bg()
         
         # 根據模式設置等待時間
         mode = self.get_current_mode()
@@ -137,6 +218,7 @@ class ReactionTestGame:
             self.wait_time = random.uniform(0.5, 1.5)
         else:
             self.wait_time = random.uniform(self.min_wait_time, self.max_wait_time)
+        self._next_transition_ms = pygame.time.get_ticks() + int(self.wait_time * 1000)
         
         # 設置信號位置（位置反應模式）
         if mode['type'] == 'position':
@@ -164,6 +246,7 @@ class ReactionTestGame:
         """顯示信號"""
         self.state = 'signal'
         self.signal_start_time = time.time()
+        self._next_transition_ms = pygame.time.get_ticks() + int(self.signal_duration * 1000)
         self.signal_pulse = 0
         
         # 播放音效（音視反應模式）
@@ -176,15 +259,27 @@ class ReactionTestGame:
     
     def create_signal_particles(self):
         """創建信號粒子效果"""
-        for _ in range(8):
+        count = 8
+        
+        # 一次產生整批隨機數
+        np = _ensure_np()
+        if np is not None:
+            velocities = _uniform32(-100, 100, (count, 2)).tolist()
+            sizes = _uniform32(3, 8, count).tolist()
+        else:
+            velocities = [(random.uniform(-100, 100), random.uniform(-100, 100)) for _ in range(count)]
+            sizes = [random.uniform(3, 8) for _ in range(count)]
+        
+        x, y = self.signal_position
+        for (vx, vy), size in zip(velocities, sizes):
             particle = {
-                'x': self.signal_position[0],
-                'y': self.signal_position[1],
-                'vx': random.uniform(-100, 100),
-                'vy': random.uniform(-100, 100),
+                'x': x,
+                'y': y,
+                'vx': vx,
+                'vy': vy,
                 'life': 1.0,
                 'color': self.current_signal_color,
-                'size': random.uniform(3, 8)
+                'size': size
             }
             self.particles.append(particle)
     
@@ -233,29 +328,47 @@ class ReactionTestGame:
     
     def create_success_particles(self):
         """創建成功反應的粒子效果"""
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
+        count = 15
+        
+        # 一次產生整批隨機數
+        np = _ensure_np()
+        if np is not None:
+            angles = _uniform32(0, 2 * math.pi, count)
+            speeds = _uniform32(50, 150, count)
+            vxs = (np.cos(angles) * speeds).tolist()
+            vys = (np.sin(angles) * speeds).tolist()
+            sizes = _uniform32(2, 6, count).tolist()
+        else:
+            angles = [random.uniform(0, 2 * math.pi) for _ in range(count)]
+            speeds = [random.uniform(50, 150) for _ in range(count)]
+            vxs = [math.cos(a) * v for a, v in zip(angles, speeds)]
+            vys = [math.sin(a) * v for a, v in zip(angles, speeds)]
+            sizes = [random.uniform(2, 6) for _ in range(count)]
+        
+        x, y = self.signal_position
+        for vx, vy, size in zip(vxs, vys, sizes):
             particle = {
-                'x': self.signal_position[0],
-                'y': self.signal_position[1],
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
+                'x': x,
+                'y': y,
+                'vx': vx,
+                'vy': vy,
                 'life': 1.5,
                 'color': self.YELLOW,
-                'size': random.uniform(2, 6)
+                'size': size
             }
             self.particles.append(particle)
     
     def finish_mode(self):
         """完成當前模式"""
         self.state = 'result'
+        self._invalidate_static_bg()
         if self.buzzer:
             self.buzzer.play_tone(frequency=1200, duration=0.5)
     
     def next_mode(self):
         """進入下一個模式"""
         self.current_mode_index += 1
+        self._invalidate_static_bg()
         if self.current_mode_index >= len(self.test_modes):
             self.game_over = True
             self.state = 'game_over'
@@ -269,13 +382,24 @@ class ReactionTestGame:
             return {}
         
         times = self.reaction_times
+        count = len(times)
+        
+        # 單次遍歷同時計算總和、最小值與最大值
+        total = fastest = slowest = times[0]
+        for t in times[1:]:
+            total += t
+            if t < fastest:
+                fastest = t
+            elif t > slowest:
+                slowest = t
+        
         return {
-            'count': len(times),
-            'average': sum(times) / len(times),
-            'fastest': min(times),
-            'slowest': max(times),
-            'median': sorted(times)[len(times) // 2],
-            'consistency': max(times) - min(times) if len(times) > 1 else 0
+            'count': count,
+            'average': total / count,
+            'fastest': fastest,
+            'slowest': slowest,
+            'median': statistics.median_high(times),
+            'consistency': slowest - fastest if count > 1 else 0
         }
     
     def get_performance_rating(self, avg_time):
@@ -357,12 +481,13 @@ class ReactionTestGame:
                 return {"game_over": self.game_over, "paused": self.paused}
         
         # 狀態機邏輯
+        now_ms = pygame.time.get_ticks()
         if self.state == 'waiting':
-            if current_time - self.wait_start_time >= self.wait_time:
+            if now_ms >= self._next_transition_ms:
                 self.show_signal()
         
         elif self.state == 'signal':
-            if current_time - self.signal_start_time >= self.signal_duration:
+            if now_ms >= self._next_transition_ms:
                 # 超時，算作錯過
                 self.missed_signals += 1
                 self.current_trial += 1
@@ -374,6 +499,14 @@ class ReactionTestGame:
     
     def render(self, screen):
         """渲染遊戲畫面"""
+        # 靜態畫面只更新變動區域
+        if self.state in self._STATIC_STATES and not self.paused and self.background_flash <= 0:
+            self._render_static(screen)
+            return
+        
+        self._static_bg = None
+        self._dirty_rects = None
+        
         # 背景
         mode = self.get_current_mode()
         bg_color = mode.get('background_color', self.BLACK)
@@ -386,6 +519,19 @@ class ReactionTestGame:
         screen.fill(bg_color)
         
         # 根據狀態渲染不同內容
+        self._render_state_content(screen)
+        if self.state == 'waiting':
+            self.render_waiting_warning(screen)
+        
+        # 渲染粒子效果
+        self.render_particles(screen)
+        
+        # 暫停畫面
+        if self.paused:
+            self.render_pause_overlay(screen)
+    
+    def _render_state_content(self, screen):
+        """根據狀態渲染主要內容"""
         if self.state == 'menu':
             self.render_menu(screen)
         elif self.state == 'instructions':
@@ -398,19 +544,40 @@ class ReactionTestGame:
             self.render_result(screen)
         elif self.game_over:
             self.render_game_over(screen)
+    
+    def _render_static(self, screen):
+        """以靜態背景快照加髒矩形方式渲染"""
+        key = (self.state, self.current_mode_index, self.current_trial)
+        
+        if (self._static_bg is None or self._static_key != key
+                or self._static_bg.get_size() != screen.get_size()):
+            # 狀態改變後的第一幀：完整繪製並保存快照
+            screen.fill(self.get_current_mode().get('background_color', self.BLACK))
+            self._render_state_content(screen)
+            self._static_bg = screen.copy()
+            self._static_key = key
+            full_redraw = True
+        else:
+            # 只還原上一幀動態內容覆蓋過的區域
+            for rect in self._prev_dynamic_rects:
+                screen.blit(self._static_bg, rect, rect)
+            full_redraw = False
         
-        # 渲染粒子效果
-        self.render_particles(screen)
+        dynamic_rects = []
+        if self.state == 'waiting':
+            warning_rect = self.render_waiting_warning(screen)
+            if warning_rect:
+                dynamic_rects.append(warning_rect)
+        dynamic_rects.extend(self.render_particles(screen))
         
-        # 暫停畫面
-        if self.paused:
-            self.render_pause_overlay(screen)
+        self._dirty_rects = None if full_redraw else self._prev_dynamic_rects + dynamic_rects
+        self._prev_dynamic_rects = dynamic_rects
     
     def render_menu(self, screen):
         """渲染選單"""
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_large = get_font(72)
+        font_medium = get_font(48)
+        font_small = get_font(36)
         
         # 標題
         title_text = font_large.render("反應力測試", True, self.WHITE)
@@ -418,16 +585,16 @@ class ReactionTestGame:
         
         # 模式選擇
         y_start = 150
-        for i, mode in enumerate(self.test_modes):
+        for i, name in enumerate(self._mode_names):
             color = self.YELLOW if i == self.current_mode_index else self.WHITE
             prefix = "▶ " if i == self.current_mode_index else "  "
             
-            mode_text = font_medium.render(f"{prefix}{mode['name']}", True, color)
+            mode_text = font_medium.render(f"{prefix}{name}", True, color)
             screen.blit(mode_text, (100, y_start + i * 60))
             
             # 模式描述
             if i == self.current_mode_index:
-                desc_text = font_small.render(mode['description'], True, self.GRAY)
+                desc_text = font_small.render(self._mode_descriptions[i], True, self.GRAY)
                 screen.blit(desc_text, (120, y_start + i * 60 + 35))
         
         # 操作提示
@@ -436,9 +603,9 @@ class ReactionTestGame:
     
     def render_instructions(self, screen):
         """渲染說明"""
-        font_large = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_large = get_font(64)
+        font_medium = get_font(48)
+        font_small = get_font(36)
         
         mode = self.get_current_mode()
         
@@ -481,8 +648,8 @@ class ReactionTestGame:
     
     def render_waiting(self, screen):
         """渲染等待畫面"""
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
+        font_large = get_font(72)
+        font_medium = get_font(48)
         
         # 等待提示
         wait_text = font_large.render("準備...", True, self.WHITE)
@@ -491,18 +658,21 @@ class ReactionTestGame:
         # 進度顯示
         progress_text = font_medium.render(f"測試 {self.current_trial + 1} / {self.trials}", True, self.GRAY)
         screen.blit(progress_text, (self.width // 2 - progress_text.get_width() // 2, self.height // 2 + 50))
-        
-        # 警告文字（閃爍）
+    
+    def render_waiting_warning(self, screen):
+        """渲染等待畫面的閃爍警告文字，返回繪製區域"""
         if int(time.time() * 2) % 2:
+            font_medium = get_font(48)
             warning_text = font_medium.render("不要提前按鍵！", True, self.RED)
-            screen.blit(warning_text, (self.width // 2 - warning_text.get_width() // 2, self.height // 2 + 100))
+            return screen.blit(warning_text, (self.width // 2 - warning_text.get_width() // 2, self.height // 2 + 100))
+        return None
     
     def render_signal(self, screen):
         """渲染信號"""
-        font_large = pygame.font.Font(None, 72)
+        font_large = get_font(72)
         
         # 信號圓圈（脈沖效果）
-        pulse_size = 80 + math.sin(self.signal_pulse) * 20
+        pulse_size = 80 + self._SIN_LUT[int(self.signal_pulse * self._SIN_LUT_SCALE) & 255] * 20
         
         pygame.draw.circle(screen, self.current_signal_color, 
                          self.signal_position, int(pulse_size))
@@ -515,15 +685,15 @@ class ReactionTestGame:
             screen.blit(react_text, (self.width // 2 - react_text.get_width() // 2, 100))
         
         # 進度顯示
-        font_medium = pygame.font.Font(None, 48)
+        font_medium = get_font(48)
         progress_text = font_medium.render(f"測試 {self.current_trial + 1} / {self.trials}", True, self.GRAY)
         screen.blit(progress_text, (self.width // 2 - progress_text.get_width() // 2, self.height - 100))
     
     def render_result(self, screen):
         """渲染結果"""
-        font_large = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_large = get_font(64)
+        font_medium = get_font(48)
+        font_small = get_font(36)
         
         mode = self.get_current_mode()
         stats = self.calculate_statistics()
@@ -578,9 +748,9 @@ class ReactionTestGame:
     
     def render_game_over(self, screen):
         """渲染遊戲結束畫面"""
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_large = get_font(72)
+        font_medium = get_font(48)
+        font_small = get_font(36)
         
         # 標題
         title_text = font_large.render("測試完成！", True, self.GREEN)
@@ -627,17 +797,31 @@ class ReactionTestGame:
         screen.blit(restart_text, (self.width // 2 - restart_text.get_width() // 2, self.height - 80))
     
     def render_particles(self, screen):
-        """渲染粒子效果"""
+        """渲染粒子效果，返回各粒子的繪製區域"""
+        batch = []
         for particle in self.particles:
             if particle['life'] > 0:
-                alpha = int(particle['life'] * 255)
+                # 透明度分成 8 級，以便重複使用預先繪製的粒子圖
+                alpha_level = min(255, int(particle['life'] * 255)) >> 5
                 size = max(1, int(particle['size'] * particle['life']))
                 
-                # 創建半透明表面
-                particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                color_with_alpha = (*particle['color'], alpha)
-                pygame.draw.circle(particle_surf, color_with_alpha, (size, size), size)
-                screen.blit(particle_surf, (particle['x'] - size, particle['y'] - size))
+                sprite = self._get_particle_sprite(particle['color'], size, alpha_level)
+                batch.append((sprite, (particle['x'] - size, particle['y'] - size)))
+        
+        if not batch:
+            return []
+        # 一次呼叫完成所有粒子的繪製
+        return screen.blits(batch)
+    
+    def _get_particle_sprite(self, color, size, alpha_level):
+        """獲取（必要時建立）指定顏色、大小與透明度的粒子圖"""
+        key = (color, size, alpha_level)
+        sprite = self._particle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha_level * 32 + 31), (size, size), size)
+            self._particle_sprites[key] = sprite
+        return sprite
     
     def render_pause_overlay(self, screen):
         """渲染暫停覆蓋層"""
@@ -645,8 +829,8 @@ class ReactionTestGame:
         overlay.fill((0, 0, 0, 128))
         screen.blit(overlay, (0, 0))
         
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
+        font_large = get_font(72)
+        font_medium = get_font(48)
         
         pause_text = font_large.render("暫停", True, self.YELLOW)
         screen.blit(pause_text, (self.width // 2 - pause_text.get_width() // 2, self.height // 2 - 50))
@@ -689,29 +873,42 @@ if __name__ == "__main__":
         running = True
         clock = pygame.time.Clock()
         
+        # 事件輪詢間隔（毫秒），每個顯示幀最多輪詢一次
+        poll_interval_ms = 16
+        last_poll_ms = -poll_interval_ms
+        controller_input = {key: False for key in key_mapping.values()}
+        keys = pygame.key.get_pressed()
+        
         while running:
-            # 處理事件
-            controller_input = {key: False for key in key_mapping.values()}
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+            # 處理事件（未到輪詢時間則沿用上次的輸入）
+            now_ms = pygame.time.get_ticks()
+            if now_ms - last_poll_ms >= poll_interval_ms:
+                last_poll_ms = now_ms
+                controller_input = {key: False for key in key_mapping.values()}
+                
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
                         running = False
-            
-            # 獲取當前按下的按鍵狀態
-            keys = pygame.key.get_pressed()
-            for key, input_name in key_mapping.items():
-                if keys[key]:
-                    controller_input[input_name] = True
+                    elif event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            running = False
+                
+                # 獲取當前按下的按鍵狀態
+                keys = pygame.key.get_pressed()
+                for key, input_name in key_mapping.items():
+                    if keys[key]:
+                        controller_input[input_name] = True
             
             # 更新遊戲
             game_status = game.update(controller_input)
             
             # 渲染
             game.render(screen)
-            pygame.display.flip()
+            dirty_rects = game.get_dirty_rects()
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
             
             # 控制幀率
             clock.tick(60)
@@ -7,17 +7,25 @@ import sys
 import time
 import json
 import logging
+import logging.handlers
+import atexit
 import threading
 import queue
+import collections
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from enum import Enum
 import pygame
 from pygame.locals import *
 import RPi.GPIO as GPIO
-import subprocess
-import signal
 import psutil
-import traceback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # 導入所需的本地模組
 from screen_menu import SPIScreenManager
@@ -27,29 +35,134 @@ from buzzer import BuzzerControl
 from traffic_light import TrafficLight
 from power_button import GameControlButton
 
+# 程式所在目錄與相關路徑（模組載入時計算一次）
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_GAMES_DIR = os.path.join(_HERE, 'games')
+_LOG_DIR = os.path.join(_HERE, 'logs')
+_CONFIG_FILE = os.path.join(_HERE, 'config.json')
+_STATS_FILE = os.path.join(_HERE, 'session_stats.jsonl')
+
 # 遊戲模組導入
-sys.path.append(os.path.join(os.path.dirname(__file__), 'games'))
-from games.game1 import SnakeGame
-from games.game2 import BrickBreakerGame
-from games.game3 import SpaceInvadersGame
-from games.game4 import TicTacToeGame
-from games.game5 import MemoryMatchGame
-from games.game6 import SimpleMazeGame
-from games.game7 import WhacAMoleGame
-from games.game8 import TetrisLikeGame
-from games.game9 import ReactionTestGame
+sys.path.append(_GAMES_DIR)
+from font_cache import get_font
+# 遊戲模組在第一次使用時才載入（見 EnhancedGameConsole._get_game_class）
 
 # 全域設定
 VERSION = "2.0.0"
 HDMI_SCREEN_WIDTH = 800
 HDMI_SCREEN_HEIGHT = 600
 FPS = 60
+STATS_KEEP_SESSIONS = 30           # 統計檔保留的會話數
+STATS_COMPACT_BYTES = 64 * 1024    # 統計檔超過此大小才進行壓縮
+TEXT_CACHE_SIZE = 128  # 動態文字表面快取的最大數量
+IDLE_FPS = 15  # 選單等靜態畫面的幀率上限
+SPI_UPDATE_INTERVAL_MS = 200  # SPI 螢幕最短更新間隔 (約 5 Hz)
+MENU_IDLE_DIM_SECONDS = 60  # 選單無操作超過此秒數時調暗 SPI 螢幕背光
 
 # 硬體 GPIO 設定
 TRAFFIC_LIGHT_RED_PIN = 4
 TRAFFIC_LIGHT_YELLOW_PIN = 3
 TRAFFIC_LIGHT_GREEN_PIN = 2
 
+# 遊戲清單項目
+Game = collections.namedtuple(
+    'Game', ['id', 'name', 'description', 'module', 'class_name', 'difficulty', 'desc_lines'],
+    defaults=((),)
+)
+
+# 遊戲目錄（常數資料）
+_GAME_CATALOG = (
+    Game(1, "貪吃蛇 (Snake)", "搖桿控制方向。按A鈕加速。避免撞牆和自己。", "games.game1", "SnakeGame", "Easy"),
+    Game(2, "打磚塊 (Brick Breaker)", "搖桿左右移動擋板。按A鈕發射球。清除所有磚塊。", "games.game2", "BrickBreakerGame", "Medium"),
+    Game(3, "太空侵略者 (Space Invaders)", "搖桿左右移動。按A鈕射擊。消滅所有外星人。", "games.game3", "SpaceInvadersGame", "Hard"),
+    Game(4, "井字遊戲 (Tic-Tac-Toe)", "搖桿選擇格子。按A鈕確認。連成一線獲勝。", "games.game4", "TicTacToeGame", "Easy"),
+    Game(5, "記憶翻牌 (Memory Match)", "搖桿選擇牌。按A鈕翻牌。記住位置配對。", "games.game5", "MemoryMatchGame", "Medium"),
+    Game(6, "簡易迷宮 (Simple Maze)", "搖桿控制方向。找到出口。時間越短越好。", "games.game6", "SimpleMazeGame", "Medium"),
+    Game(7, "打地鼠 (Whac-A-Mole)", "搖桿移動槌子。按A鈕敲擊。反應要快！", "games.game7", "WhacAMoleGame", "Hard"),
+    Game(8, "俄羅斯方塊 (Tetris-like)", "搖桿移動旋轉。消除滿行得分。速度會加快。", "games.game8", "TetrisLikeGame", "Hard"),
+    Game(9, "反應力測試 (Reaction Test)", "出現信號時按A鈕。測試反應速度極限。", "games.game9", "ReactionTestGame", "Medium")
+)
+
+@functools.lru_cache(maxsize=1)
+def get_game_catalog():
+    """返回遊戲目錄，說明文字預先依句號切成多行（只計算一次）"""
+    return tuple(
+        game._replace(desc_lines=tuple(
+            line.strip() + "。" for line in game.description.split('。') if line.strip()
+        ))
+        for game in _GAME_CATALOG
+    )
+
+# 難度對應的顯示顏色
+_DIFFICULTY_COLORS = {
+    "Easy": (0, 255, 0),
+    "Medium": (255, 255, 0),
+    "Hard": (255, 0, 0)
+}
+_DEFAULT_DIFF_COLOR = (255, 255, 255)
+
+# 本幀尚未讀取輸入的標記
+_NOT_READ = object()
+
+def _center_x(surface):
+    """返回使表面在 HDMI 畫面水平置中的 X 座標"""
+    return (HDMI_SCREEN_WIDTH - surface.get_width()) >> 1
+
+
+class NullBuzzer:
+    """蜂鳴器不可用時的替代物件，所有方法皆不做任何事"""
+    
+    def __bool__(self):
+        return False
+    
+    def play_tone(self, *args, **kwargs):
+        pass
+    
+    def play_melody(self, *args, **kwargs):
+        pass
+    
+    def play_startup_melody(self):
+        pass
+    
+    def play_win_melody(self):
+        pass
+    
+    def play_game_over_melody(self):
+        pass
+    
+    def play_victory_fanfare(self):
+        pass
+    
+    def stop_all(self):
+        pass
+    
+    def cleanup(self):
+        pass
+
+class NullTrafficLight:
+    """交通燈不可用時的替代物件，所有方法皆不做任何事"""
+    
+    def __bool__(self):
+        return False
+    
+    def set_light(self, color, state):
+        pass
+    
+    def all_off(self):
+        pass
+    
+    def red_on(self):
+        pass
+    
+    def yellow_on(self):
+        pass
+    
+    def green_on(self):
+        pass
+    
+    def cleanup(self):
+        pass
+
 class GameState(Enum):
     """遊戲狀態枚舉"""
     STARTUP = "startup"
@@ -63,11 +176,23 @@ class GameState(Enum):
     SHUTDOWN = "shutdown"
     ERROR = "error"
 
+# 主循環會處理的 Pygame 事件類型
+_HANDLED_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN)
+
+# 畫面不含動畫的狀態，以 IDLE_FPS 運行主循環
+_IDLE_STATES = frozenset({
+    GameState.MENU,
+    GameState.INSTRUCTION,
+    GameState.GAME_PAUSED,
+    GameState.GAME_OVER,
+    GameState.ERROR
+})
+
 class SystemConfig:
     """系統配置管理類"""
     
     def __init__(self):
-        self.config_file = os.path.join(os.path.dirname(__file__), 'config.json')
+        self.config_file = _CONFIG_FILE
         self.default_config = {
             "display": {
                 "hdmi_width": HDMI_SCREEN_WIDTH,
@@ -99,25 +224,33 @@ class SystemConfig:
         """載入配置檔案"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    # 合併預設配置
-                    return self._merge_config(self.default_config, config)
+                if ORJSON_AVAILABLE:
+                    with open(self.config_file, 'rb') as f:
+                        config = orjson.loads(f.read())
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
+                # 合併預設配置
+                return self._merge_config(self.default_config, config)
             else:
                 self.save_config(self.default_config)
                 return self.default_config.copy()
         except Exception as e:
-            logging.error(f"載入配置失敗: {e}")
+            logging.error("載入配置失敗: %s", e)
             return self.default_config.copy()
     
     def save_config(self, config=None):
         """儲存配置檔案"""
         try:
             config_to_save = config or self.config
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_to_save, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(config_to_save, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(config_to_save, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            logging.error(f"儲存配置失敗: {e}")
+            logging.error("儲存配置失敗: %s", e)
     
     def _merge_config(self, default, user):
         """合併配置"""
@@ -137,9 +270,20 @@ class PerformanceMonitor:
         self.frame_count = 0
         self.fps_history = []
         self.cpu_usage = 0
+        self.process_cpu_usage = 0
         self.memory_usage = 0
         self.temperature = 0
         
+        # 本程式的 Process 物件只建立一次，並先呼叫一次 cpu_percent 建立基準值
+        self._process = psutil.Process()
+        self._process.cpu_percent(interval=None)
+        
+        # 溫度檔案只開啟一次，之後每次取樣 seek(0) 重新讀取
+        try:
+            self._temp_file = open('/sys/class/thermal/thermal_zone0/temp', 'r')
+        except OSError:
+            self._temp_file = None
+        
     def update(self):
         """更新性能數據"""
         self.frame_count += 1
@@ -155,20 +299,30 @@ class PerformanceMonitor:
             self.frame_count = 0
             self.start_time = current_time
             
-            # 更新系統資源使用率
-            self.cpu_usage = psutil.cpu_percent()
-            self.memory_usage = psutil.virtual_memory().percent
-            
             # 嘗試讀取CPU溫度
-            try:
-                with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                    self.temperature = int(f.read()) / 1000.0
-            except:
-                self.temperature = 0
+            if self._temp_file:
+                try:
+                    self._temp_file.seek(0)
+                    self.temperature = int(self._temp_file.read()) / 1000.0
+                except (OSError, ValueError):
+                    self.temperature = 0
+    
+    def sample_system(self):
+        """取樣系統資源使用率（只由系統監控線程呼叫）"""
+        # cpu_percent(interval=None) 返回自上次呼叫以來的使用率，必須只有單一呼叫者
+        self.cpu_usage = psutil.cpu_percent(interval=None)
+        self.process_cpu_usage = self._process.cpu_percent(interval=None)
+        self.memory_usage = psutil.virtual_memory().percent
     
     def get_average_fps(self):
         """獲取平均FPS"""
         return sum(self.fps_history) / len(self.fps_history) if self.fps_history else 0
+    
+    def close(self):
+        """關閉溫度檔案"""
+        if self._temp_file:
+            self._temp_file.close()
+            self._temp_file = None
 
 class EnhancedGameConsole:
     """增強版多功能遊戲機主控制類"""
@@ -179,20 +333,15 @@ class EnhancedGameConsole:
         
         # 載入配置
         self.config = SystemConfig()
-        logging.info(f"遊戲機系統啟動 v{VERSION}")
+        logging.info("遊戲機系統啟動 v%s", VERSION)
+        
+        # 主循環每幀使用的設定值，預先取出避免逐幀查找巢狀字典
+        self._fps = self.config.config["display"]["fps"]
+        self._show_fps = self.config.config["debug"]["show_fps"]
+        self._hw_monitor = self.config.config["debug"]["hardware_monitor"]
         
         # 初始化遊戲列表
-        self.games = [
-            {"id": 1, "name": "貪吃蛇 (Snake)", "description": "搖桿控制方向。按A鈕加速。避免撞牆和自己。", "game_class": SnakeGame, "difficulty": "Easy"},
-            {"id": 2, "name": "打磚塊 (Brick Breaker)", "description": "搖桿左右移動擋板。按A鈕發射球。清除所有磚塊。", "game_class": BrickBreakerGame, "difficulty": "Medium"},
-            {"id": 3, "name": "太空侵略者 (Space Invaders)", "description": "搖桿左右移動。按A鈕射擊。消滅所有外星人。", "game_class": SpaceInvadersGame, "difficulty": "Hard"},
-            {"id": 4, "name": "井字遊戲 (Tic-Tac-Toe)", "description": "搖桿選擇格子。按A鈕確認。連成一線獲勝。", "game_class": TicTacToeGame, "difficulty": "Easy"},
-            {"id": 5, "name": "記憶翻牌 (Memory Match)", "description": "搖桿選擇牌。按A鈕翻牌。記住位置配對。", "game_class": MemoryMatchGame, "difficulty": "Medium"},
-            {"id": 6, "name": "簡易迷宮 (Simple Maze)", "description": "搖桿控制方向。找到出口。時間越短越好。", "game_class": SimpleMazeGame, "difficulty": "Medium"},
-            {"id": 7, "name": "打地鼠 (Whac-A-Mole)", "description": "搖桿移動槌子。按A鈕敲擊。反應要快！", "game_class": WhacAMoleGame, "difficulty": "Hard"},
-            {"id": 8, "name": "俄羅斯方塊 (Tetris-like)", "description": "搖桿移動旋轉。消除滿行得分。速度會加快。", "game_class": TetrisLikeGame, "difficulty": "Hard"},
-            {"id": 9, "name": "反應力測試 (Reaction Test)", "description": "出現信號時按A鈕。測試反應速度極限。", "game_class": ReactionTestGame, "difficulty": "Medium"}
-        ]
+        self.games = get_game_catalog()
         
         # 系統狀態
         self.state = GameState.STARTUP
@@ -200,6 +349,7 @@ class EnhancedGameConsole:
         self.current_selection = 0
         self.current_game = None
         self.running = True
+        self.game_over_deadline = None  # 遊戲結束畫面返回選單的時間點 (pygame ticks)
         
         # 硬體組件
         self.hdmi_screen = None
@@ -207,9 +357,12 @@ class EnhancedGameConsole:
         self.spi_screen = None
         self.keypad = None
         self.controller = None
-        self.buzzer = None
-        self.traffic_light = None
+        self.buzzer = NullBuzzer()              # 初始化成功後替換為實際裝置
+        self.traffic_light = NullTrafficLight()
         self.power_button = None
+        # 已初始化的硬體組件 (名稱, 物件)，兩條清理路徑共用
+        self._hw_registry = []
+        self._cleaned_up = False
         
         # 性能監控
         self.performance_monitor = PerformanceMonitor()
@@ -217,9 +370,62 @@ class EnhancedGameConsole:
         # 事件佇列
         self.event_queue = queue.Queue()
         
+        # 延遲執行的動作 (deadline_ticks, action)，由主循環每幀處理
+        self._scheduled = collections.deque()
+        
+        # 本幀的 Pygame 事件（每幀只抽取一次）
+        self.frame_events = []
+        
+        # 本幀的輸入快取，每幀開始時清除
+        self._frame_key = _NOT_READ
+        self._frame_input = _NOT_READ
+        
+        # HDMI 字體與預先渲染的文字表面（在 _init_pygame 後建立）
+        self.fonts = {}
+        self._title_surface = None
+        self._menu_surfaces = []
+        self._menu_diff_surfaces = []
+        self._instr_cache = {}
+        self._static_text = {}
+        self._text_cache = {}  # {(font_key, text, color): Surface}，依插入順序淘汰
+        self._stats_cache = (None, None)
+        self._menu_bg_surface = None
+        self._menu_highlight_surface = None
+        self._menu_highlight_index = None
+        
+        # HDMI 畫面目前內容的識別鍵，None 表示需完整重繪
+        self._last_render_key = None
+        self._debug_rect = None  # 上一次除錯資訊的繪製範圍
+        
+        # 背景預先建立的遊戲實例 {game_id: instance}
+        self._warm_games = {}
+        
+        # 已載入的遊戲類別 {game_id: class}
+        self._game_classes = {}
+        
+        # SPI 螢幕目前內容的識別鍵與下次允許更新的時間 (pygame ticks)
+        self._spi_last_key = None
+        self._spi_next_update = 0
+        
         # 輸入處理
-        self.last_input_time = 0
+        self.last_input_time = time.time()  # 同時作為選單閒置計時的起點
         self.input_cooldown = 0.2  # 輸入冷卻時間
+        self._digit_keys = frozenset('123456789')  # 選單可直接選擇遊戲的數字鍵
+        self._menu_letter_actions = {
+            'D': self._turn_off_traffic_light
+        }
+        
+        # 狀態處理函式對照表
+        self._state_handlers = {
+            GameState.STARTUP: self._handle_startup,
+            GameState.MENU: self._handle_menu,
+            GameState.INSTRUCTION: self._handle_instruction,
+            GameState.GAME_STARTING: self._handle_game_starting,
+            GameState.GAME: self._handle_game,
+            GameState.GAME_PAUSED: self._handle_game_paused,
+            GameState.GAME_OVER: self._handle_game_over,
+            GameState.ERROR: self._handle_error
+        }
         
         # 統計數據
         self.session_stats = {
@@ -228,28 +434,43 @@ class EnhancedGameConsole:
             "total_score": 0,
             "best_scores": {}
         }
+        # 會話識別與開始時間字串在啟動時格式化一次
+        self._session_id = self.session_stats["start_time"].strftime("%Y%m%d_%H%M%S")
+        self._session_start_iso = self.session_stats["start_time"].isoformat()
         
         # 線程控制
         self.monitor_thread = None
         self.monitor_running = False
+        self._monitor_stop = threading.Event()
         
         logging.info("遊戲機系統初始化完成")
 
     def _setup_logging(self):
         """設置日誌系統"""
-        log_dir = os.path.join(os.path.dirname(__file__), 'logs')
+        log_dir = _LOG_DIR
         os.makedirs(log_dir, exist_ok=True)
         
         log_file = os.path.join(log_dir, f'gamebox_{datetime.now().strftime("%Y%m%d")}.log')
         
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        # 呼叫端只把紀錄放入佇列，檔案與終端輸出由背景線程處理
+        log_queue = queue.Queue(-1)
+        # QueueHandler 只傳遞原始訊息，實際格式由監聽線程的處理器套用
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
+            format='%(message)s',
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        self._log_listener.start()
+        
+        # cleanup() 之後主程式仍會寫日誌，於程序結束時才停止並清空佇列
+        atexit.register(self._log_listener.stop)
 
     def initialize_hardware(self):
         """初始化所有硬體元件 - 增強版"""
@@ -264,55 +485,55 @@ class EnhancedGameConsole:
             if not self._init_pygame():
                 return False
             
-            # 硬體組件初始化
-            hardware_results = {}
-            
-            # SPI 螢幕
-            if self.config.config["hardware"]["spi_screen_enabled"]:
-                hardware_results["spi_screen"] = self._init_spi_screen()
-            
-            # 矩陣鍵盤
-            if self.config.config["hardware"]["matrix_keypad_enabled"]:
-                hardware_results["keypad"] = self._init_keypad()
-            
-            # Xbox 控制器
-            if self.config.config["hardware"]["xbox_controller_enabled"]:
-                hardware_results["controller"] = self._init_controller()
-            
-            # 蜂鳴器
+            # 硬體組件初始化：各組件互不相依，GPIO/SPI 的初始化在線程池中並行執行
+            hardware_config = self.config.config["hardware"]
+            tasks = {}
+            if hardware_config["spi_screen_enabled"]:
+                tasks["spi_screen"] = self._init_spi_screen
+            if hardware_config["matrix_keypad_enabled"]:
+                tasks["keypad"] = self._init_keypad
             if self.config.config["audio"]["enable_buzzer"]:
-                hardware_results["buzzer"] = self._init_buzzer()
+                tasks["buzzer"] = self._init_buzzer
+            if hardware_config["traffic_light_enabled"]:
+                tasks["traffic_light"] = self._init_traffic_light
+            if hardware_config["power_button_enabled"]:
+                tasks["power_button"] = self._init_power_button
             
-            # 交通燈
-            if self.config.config["hardware"]["traffic_light_enabled"]:
-                hardware_results["traffic_light"] = self._init_traffic_light()
-            
-            # 電源按鈕
-            if self.config.config["hardware"]["power_button_enabled"]:
-                hardware_results["power_button"] = self._init_power_button()
+            hardware_results = {}
+            with ThreadPoolExecutor(max_workers=max(len(tasks), 1)) as executor:
+                futures = {name: executor.submit(init) for name, init in tasks.items()}
+                
+                # Xbox 控制器使用 pygame joystick，留在主線程初始化
+                if hardware_config["xbox_controller_enabled"]:
+                    hardware_results["controller"] = self._init_controller()
+                
+                for name, future in futures.items():
+                    hardware_results[name] = future.result()
             
             # 檢查硬體初始化結果
             failed_components = [k for k, v in hardware_results.items() if not v]
             if failed_components:
-                logging.warning(f"以下硬體組件初始化失敗: {failed_components}")
+                logging.warning("以下硬體組件初始化失敗: %s", failed_components)
                 # 可以選擇繼續運行或停止
                 if len(failed_components) > len(hardware_results) / 2:
                     logging.error("超過一半的硬體組件初始化失敗，停止啟動")
                     return False
             
             # 啟動系統監控
-            if self.config.config["debug"]["hardware_monitor"]:
+            if self._hw_monitor:
                 self._start_system_monitor()
             
             # 播放啟動音效和燈效
             self._play_startup_sequence()
             
+            # 在選單期間於背景預先建立遊戲實例
+            threading.Thread(target=self._warm_all_games, daemon=True).start()
+            
             logging.info("硬體初始化完成")
             return True
             
         except Exception as e:
-            logging.error(f"硬體初始化過程中發生嚴重錯誤: {e}")
-            logging.error(traceback.format_exc())
+            logging.exception("硬體初始化過程中發生嚴重錯誤: %s", e)
             self._cleanup_on_error()
             return False
 
@@ -324,7 +545,7 @@ class EnhancedGameConsole:
             logging.info("GPIO 初始化成功")
             return True
         except Exception as e:
-            logging.error(f"GPIO 初始化失敗: {e}")
+            logging.error("GPIO 初始化失敗: %s", e)
             return False
 
     def _init_pygame(self):
@@ -337,47 +558,156 @@ class EnhancedGameConsole:
             if self.config.config["display"]["fullscreen"]:
                 flags |= pygame.FULLSCREEN
             
-            self.hdmi_screen = pygame.display.set_mode(
-                (self.config.config["display"]["hdmi_width"], 
-                 self.config.config["display"]["hdmi_height"]), 
-                flags
-            )
+            size = (self.config.config["display"]["hdmi_width"],
+                    self.config.config["display"]["hdmi_height"])
+            try:
+                # SCALED 使用 SDL 的硬體縮放與翻頁，vsync 讓 flip 等待垂直同步
+                self.hdmi_screen = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+            except (pygame.error, TypeError) as e:
+                logging.warning("無法啟用垂直同步，使用一般顯示模式: %s", e)
+                self.hdmi_screen = pygame.display.set_mode(size, flags)
             self.clock = pygame.time.Clock()
             
+            # 只讓 SDL 佇列主循環會處理的事件（如滑鼠移動不再進入佇列）
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(_HANDLED_EVENT_TYPES))
+            
+            self._load_hdmi_resources()
+            
             logging.info("Pygame 初始化成功")
             return True
         except Exception as e:
-            logging.error(f"Pygame 初始化失敗: {e}")
+            logging.error("Pygame 初始化失敗: %s", e)
             return False
 
+    def _load_hdmi_resources(self):
+        """建立HDMI字體並預先渲染選單與說明畫面的靜態文字"""
+        self.fonts = {
+            'title': get_font(72),
+            'item': get_font(48),
+            'info': get_font(24),
+            'text': get_font(36),
+            'hint': get_font(48)
+        }
+        
+        # 選單：標題與每個遊戲的（選中, 未選中）兩種顏色
+        self._title_surface = self._prerender('title', f"多功能遊戲機 v{VERSION}", (255, 255, 255))
+        self._menu_surfaces = []
+        self._menu_diff_surfaces = []
+        for game in self.games:
+            item_text = f"{game.id}. {game.name}"
+            self._menu_surfaces.append((
+                self._prerender('item', item_text, (255, 255, 0)),
+                self._prerender('item', item_text, (200, 200, 200))
+            ))
+            
+            difficulty = game.difficulty
+            difficulty_color = _DIFFICULTY_COLORS.get(difficulty, _DEFAULT_DIFF_COLOR)
+            self._menu_diff_surfaces.append(
+                self._prerender('info', f"[{difficulty}]", difficulty_color)
+            )
+        
+        # 暫停與錯誤畫面的固定文字
+        self._static_text = {
+            'paused': self._prerender('title', "遊戲已暫停", (255, 255, 255)),
+            'paused_hint': self._prerender('text', "按電源按鈕繼續", (200, 200, 200)),
+            'error': self._prerender('item', "系統錯誤", (255, 255, 255))
+        }
+        
+        # 選單背景在第一次繪製時建立
+        self._menu_bg_surface = None
+        self._menu_highlight_index = None
+        
+        # 說明畫面：每個遊戲合成好的整頁表面，第一次顯示時建立
+        self._instr_cache = {}
+        
+        self._text_cache = {}
+        
+        # 重新初始化後HDMI畫面需完整重繪
+        self._last_render_key = None
+
+    def _prerender(self, font_key, text, color):
+        """渲染靜態文字並轉換為顯示器像素格式，使之後的 blit 不需逐像素轉換"""
+        surface = self.fonts[font_key].render(text, True, color)
+        # 尚未建立顯示模式時無法轉換格式，直接返回原表面
+        if self.hdmi_screen is None:
+            return surface
+        return surface.convert_alpha(self.hdmi_screen)
+
+    def _render_text(self, font_key, text, color):
+        """渲染會重複出現的動態文字（如除錯數值），結果以 FIFO 快取"""
+        key = (font_key, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = self._prerender(font_key, text, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def _build_instruction_surfaces(self, game_data):
+        """渲染單一遊戲說明畫面的所有文字，返回 (表面, 位置) 列表"""
+        blits = []
+        
+        title_surface = self._prerender('title', game_data.name, (255, 255, 255))
+        blits.append((title_surface, (_center_x(title_surface), 100)))
+        
+        # 難度顯示
+        difficulty = game_data.difficulty
+        diff_color = _DIFFICULTY_COLORS.get(difficulty, _DEFAULT_DIFF_COLOR)
+        
+        diff_surface = self._prerender('text', f"難度: {difficulty}", diff_color)
+        blits.append((diff_surface, (_center_x(diff_surface), 160)))
+        
+        # 遊戲說明
+        y_offset = 0
+        for line in game_data.desc_lines:
+            desc_surface = self._prerender('text', line, (200, 200, 200))
+            blits.append((desc_surface, (_center_x(desc_surface), 220 + y_offset)))
+            y_offset += 40
+
+        hint_surface = self._prerender('hint', "按 A/確認 開始遊戲 或 B/返回 返回選單", (150, 150, 150))
+        blits.append((hint_surface, (_center_x(hint_surface), HDMI_SCREEN_HEIGHT - 100)))
+        
+        return blits
+
+    def _register_hw(self, name, component):
+        """登記硬體組件供清理使用，回傳組件本身"""
+        self._hw_registry.append((name, component))
+        return component
+
     def _init_spi_screen(self):
         """初始化SPI螢幕"""
         try:
-            self.spi_screen = SPIScreenManager()
+            self.spi_screen = self._register_hw("SPI螢幕", SPIScreenManager())
             if self.spi_screen.device:
+                # 遊戲說明在初始化時先排版，開啟說明畫面時直接使用
+                self.spi_screen.preload_games(self.games)
                 logging.info("SPI 螢幕初始化成功")
                 return True
             else:
                 logging.warning("SPI 螢幕初始化失敗")
                 return False
         except Exception as e:
-            logging.error(f"SPI 螢幕初始化錯誤: {e}")
+            logging.error("SPI 螢幕初始化錯誤: %s", e)
             return False
 
     def _init_keypad(self):
         """初始化矩陣鍵盤"""
         try:
-            self.keypad = MatrixKeypad()
+            self.keypad = self._register_hw("矩陣鍵盤", MatrixKeypad())
             logging.info("矩陣鍵盤初始化成功")
             return True
         except Exception as e:
-            logging.error(f"矩陣鍵盤初始化失敗: {e}")
+            logging.error("矩陣鍵盤初始化失敗: %s", e)
             return False
 
     def _init_controller(self):
         """初始化Xbox控制器"""
         try:
-            self.controller = XboxController()
+            self.controller = self._register_hw("Xbox控制器", XboxController())
+            # 主循環每幀統一抽取事件，控制器不必再自行 pump
+            self.controller.auto_pump = False
             if self.controller.is_connected:
                 logging.info("Xbox 控制器初始化成功")
                 return True
@@ -385,42 +715,42 @@ class EnhancedGameConsole:
                 logging.warning("Xbox 控制器未連接")
                 return False
         except Exception as e:
-            logging.error(f"Xbox 控制器初始化失敗: {e}")
+            logging.error("Xbox 控制器初始化失敗: %s", e)
             return False
 
     def _init_buzzer(self):
         """初始化蜂鳴器"""
         try:
-            self.buzzer = BuzzerControl()
+            self.buzzer = self._register_hw("蜂鳴器", BuzzerControl())
             logging.info("蜂鳴器初始化成功")
             return True
         except Exception as e:
-            logging.error(f"蜂鳴器初始化失敗: {e}")
+            logging.error("蜂鳴器初始化失敗: %s", e)
             return False
 
     def _init_traffic_light(self):
         """初始化交通燈"""
         try:
-            self.traffic_light = TrafficLight(
+            self.traffic_light = self._register_hw("交通燈", TrafficLight(
                 red_pin=TRAFFIC_LIGHT_RED_PIN,
                 yellow_pin=TRAFFIC_LIGHT_YELLOW_PIN,
                 green_pin=TRAFFIC_LIGHT_GREEN_PIN
-            )
+            ))
             logging.info("交通燈初始化成功")
             return True
         except Exception as e:
-            logging.error(f"交通燈初始化失敗: {e}")
+            logging.error("交通燈初始化失敗: %s", e)
             return False
 
     def _init_power_button(self):
         """初始化電源按鈕"""
         try:
-            self.power_button = GameControlButton(main_console_instance=self)
+            self.power_button = self._register_hw("電源按鈕", GameControlButton(main_console_instance=self))
             self.power_button.start_monitoring()
             logging.info("電源按鈕初始化成功")
             return True
         except Exception as e:
-            logging.error(f"電源按鈕初始化失敗: {e}")
+            logging.error("電源按鈕初始化失敗: %s", e)
             return False
 
     def _start_system_monitor(self):
@@ -431,51 +761,62 @@ class EnhancedGameConsole:
             self.monitor_thread.start()
             logging.info("系統監控已啟動")
         except Exception as e:
-            logging.error(f"系統監控啟動失敗: {e}")
+            logging.error("系統監控啟動失敗: %s", e)
 
     def _system_monitor_loop(self):
         """系統監控循環"""
-        while self.monitor_running:
+        # 第一次呼叫 cpu_percent 只建立基準值，固定返回 0
+        psutil.cpu_percent(interval=None)
+        
+        # 每5秒檢查一次，停止時 wait 立即返回
+        while not self._monitor_stop.wait(5):
             try:
                 # 監控系統資源
-                cpu_usage = psutil.cpu_percent()
-                memory_usage = psutil.virtual_memory().percent
+                self.performance_monitor.sample_system()
+                cpu_usage = self.performance_monitor.cpu_usage
+                memory_usage = self.performance_monitor.memory_usage
                 
                 # 如果資源使用率過高，記錄警告
                 if cpu_usage > 80:
-                    logging.warning(f"CPU 使用率過高: {cpu_usage}%")
+                    logging.warning("CPU 使用率過高: %s%%", cpu_usage)
                 if memory_usage > 80:
-                    logging.warning(f"記憶體使用率過高: {memory_usage}%")
-                
-                # 檢查硬體狀態
-                if self.controller and not self.controller.is_connected:
-                    self.controller.check_connection()
-                
-                time.sleep(5)  # 每5秒檢查一次
+                    logging.warning("記憶體使用率過高: %s%%", memory_usage)
                 
             except Exception as e:
-                logging.error(f"系統監控錯誤: {e}")
-                time.sleep(1)
+                logging.error("系統監控錯誤: %s", e)
 
     def _play_startup_sequence(self):
         """播放啟動序列"""
-        if self.config.config["audio"]["startup_sound"] and self.buzzer:
+        if self.config.config["audio"]["startup_sound"]:
             try:
                 self.buzzer.play_startup_melody()
             except Exception as e:
-                logging.error(f"播放啟動音效失敗: {e}")
+                logging.error("播放啟動音效失敗: %s", e)
         
-        if self.traffic_light:
+        # 交由主循環依時間執行，不阻塞啟動流程
+        now = pygame.time.get_ticks()
+        sequence = [
+            self.traffic_light.green_on,
+            self.traffic_light.yellow_on,
+            self.traffic_light.red_on,
+            self.traffic_light.all_off
+        ]
+        for i, action in enumerate(sequence):
+            self._schedule(now + i * 300, action)
+
+    def _schedule(self, deadline, action):
+        """排程在指定時間點 (pygame ticks) 執行動作，deadline 須依序遞增"""
+        self._scheduled.append((deadline, action))
+
+    def _tick_schedule(self):
+        """執行所有已到期的排程動作"""
+        now = pygame.time.get_ticks()
+        while self._scheduled and self._scheduled[0][0] <= now:
+            _, action = self._scheduled.popleft()
             try:
-                self.traffic_light.green_on()
-                time.sleep(0.3)
-                self.traffic_light.yellow_on()
-                time.sleep(0.3)
-                self.traffic_light.red_on()
-                time.sleep(0.3)
-                self.traffic_light.all_off()
+                action()
             except Exception as e:
-                logging.error(f"啟動燈效失敗: {e}")
+                logging.error("排程動作執行失敗: %s", e)
 
     def run(self):
         """主循環 - 增強版"""
@@ -492,25 +833,36 @@ class EnhancedGameConsole:
         # 狀態機主循環
         while self.running:
             try:
+                # 每幀只抽取一次 SDL 事件佇列（其他類型已在初始化時封鎖）
+                self.frame_events = pygame.event.get(eventtype=_HANDLED_EVENT_TYPES)
+                self._frame_key = _NOT_READ
+                self._frame_input = _NOT_READ
+                
+                # 執行到期的排程動作
+                self._tick_schedule()
+                
                 # 處理電源按鈕事件
                 self._handle_power_button_events()
                 
                 # 更新性能監控
-                if self.config.config["debug"]["hardware_monitor"]:
+                if self._hw_monitor:
                     self.performance_monitor.update()
                 
                 # 狀態處理
                 self._handle_current_state()
                 
                 # 處理Pygame事件
-                self._handle_pygame_events()
+                if self.frame_events:
+                    self._handle_pygame_events(self.frame_events)
                 
-                # 控制幀率
-                self.clock.tick(self.config.config["display"]["fps"])
+                # 控制幀率（靜態畫面降低幀率）
+                if self.state in _IDLE_STATES:
+                    self.clock.tick(IDLE_FPS)
+                else:
+                    self.clock.tick(self._fps)
                 
             except Exception as e:
-                logging.error(f"主循環錯誤: {e}")
-                logging.error(traceback.format_exc())
+                logging.exception("主循環錯誤: %s", e)
                 self.state = GameState.ERROR
                 
         self.cleanup()
@@ -522,22 +874,20 @@ class EnhancedGameConsole:
         
         events = self.power_button.get_pending_events()
         for event in events:
-            if event['action'] == 'toggle_pause':
+            if event.action == 'toggle_pause':
                 self._handle_pause_toggle()
-            elif event['action'] == 'return_to_menu':
+            elif event.action == 'return_to_menu':
                 self._handle_return_to_menu()
 
     def _handle_pause_toggle(self):
         """處理暫停切換"""
         if self.state == GameState.GAME:
             self.state = GameState.GAME_PAUSED
-            if self.traffic_light:
-                self.traffic_light.yellow_on()
+            self.traffic_light.yellow_on()
             logging.info("遊戲已暫停")
         elif self.state == GameState.GAME_PAUSED:
             self.state = GameState.GAME
-            if self.traffic_light:
-                self.traffic_light.green_on()
+            self.traffic_light.green_on()
             logging.info("遊戲已繼續")
 
     def _handle_return_to_menu(self):
@@ -546,28 +896,19 @@ class EnhancedGameConsole:
             if self.current_game:
                 self.end_current_game()
             self.state = GameState.MENU
-            if self.traffic_light:
-                self.traffic_light.all_off()
+            self.traffic_light.all_off()
             logging.info("已返回主選單")
 
     def _handle_current_state(self):
         """處理當前狀態"""
-        if self.state == GameState.STARTUP:
-            self._handle_startup()
-        elif self.state == GameState.MENU:
-            self._handle_menu()
-        elif self.state == GameState.INSTRUCTION:
-            self._handle_instruction()
-        elif self.state == GameState.GAME_STARTING:
-            self._handle_game_starting()
-        elif self.state == GameState.GAME:
-            self._handle_game()
-        elif self.state == GameState.GAME_PAUSED:
-            self._handle_game_paused()
-        elif self.state == GameState.GAME_OVER:
-            self._handle_game_over()
-        elif self.state == GameState.ERROR:
-            self._handle_error()
+        state = self.state
+        handler = self._state_handlers.get(state)
+        if handler:
+            handler()
+        
+        # 遊戲每幀直接改寫HDMI畫面，之後的靜態畫面需重新完整繪製
+        if state == GameState.GAME:
+            self._last_render_key = None
 
     def _handle_startup(self):
         """處理啟動狀態"""
@@ -575,24 +916,75 @@ class EnhancedGameConsole:
 
     def _handle_menu(self):
         """處理選單狀態"""
-        # ...existing menu code...
-        if self.spi_screen and self.spi_screen.device:
-            self.spi_screen.display_menu(self.games, self.current_selection)
+        self._refresh_spi((GameState.MENU, self.current_selection),
+                          self.spi_screen.display_menu if self.spi_screen else None,
+                          self.games, self.current_selection)
         
         # 處理輸入
         if self._can_process_input():
             self._process_menu_input()
         
+        # 閒置時調暗背光，有輸入後恢復（只在狀態改變時寫入 PWM）
+        if self.spi_screen and self.spi_screen.device:
+            self.spi_screen.set_idle(time.time() - self.last_input_time >= MENU_IDLE_DIM_SECONDS)
+        
         # 渲染HDMI畫面
         if self.hdmi_screen:
-            self.hdmi_screen.fill((0, 0, 0))
-            self._render_menu_on_hdmi()
+            show_fps = self._show_fps
+            render_key = (GameState.MENU, self.current_selection, show_fps)
+            last_key = self._last_render_key
             
-            # 顯示性能資訊（如果啟用）
-            if self.config.config["debug"]["show_fps"]:
-                self._render_debug_info()
+            if last_key is None or last_key[0] != GameState.MENU or last_key[2] != show_fps:
+                # 剛進入選單或切換除錯資訊時整個畫面重繪
+                self._render_menu_on_hdmi()
+                
+                # 顯示性能資訊（如果啟用）
+                if show_fps:
+                    self._debug_rect = self._render_debug_info()
+                
+                pygame.display.flip()
+            else:
+                dirty_rects = []
+                if render_key != last_key:
+                    # 只重繪高亮改變的兩個項目
+                    dirty_rects.append(self._redraw_menu_item(last_key[1]))
+                    dirty_rects.append(self._redraw_menu_item(self.current_selection))
+                
+                if show_fps:
+                    # 從背景還原上一幀的除錯資訊區域後重繪
+                    prev_rect = self._debug_rect
+                    self.hdmi_screen.blit(self._menu_bg_surface, prev_rect, prev_rect)
+                    self._debug_rect = self._render_debug_info()
+                    dirty_rects.append(self._debug_rect.union(prev_rect))
+                
+                # 內容未變時完全跳過繪製
+                self._present(dirty_rects)
             
+            self._last_render_key = render_key
+
+    def _present(self, dirty_rects):
+        """將畫面送出顯示：None 表示整個畫面，空列表表示不需更新"""
+        if dirty_rects is None:
             pygame.display.flip()
+        elif dirty_rects:
+            # 變動區域合計超過半個畫面時，逐一更新小矩形反而比整體翻頁慢
+            area = sum(rect.width * rect.height for rect in dirty_rects)
+            if area * 2 > HDMI_SCREEN_WIDTH * HDMI_SCREEN_HEIGHT:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+
+    def _get_key_cached(self):
+        """獲取本幀的矩陣鍵盤輸入（每幀最多掃描一次）"""
+        if self._frame_key is _NOT_READ:
+            self._frame_key = self.keypad.get_key()
+        return self._frame_key
+
+    def _get_input_cached(self):
+        """獲取本幀的Xbox控制器輸入（每幀最多讀取一次）"""
+        if self._frame_input is _NOT_READ:
+            self._frame_input = self.controller.get_input()
+        return self._frame_input
 
     def _can_process_input(self):
         """檢查是否可以處理輸入（避免過於頻繁）"""
@@ -605,58 +997,66 @@ class EnhancedGameConsole:
         """處理選單輸入"""
         # 矩陣鍵盤輸入
         if self.keypad:
-            key_pressed = self.keypad.get_key()
+            key_pressed = self._get_key_cached()
             if key_pressed is not None:
                 self.last_input_time = time.time()
                 
-                try:
+                if key_pressed in self._digit_keys:
                     key_value = int(key_pressed)
-                    if 1 <= key_value <= 9 and key_value <= len(self.games):
-                        if self.buzzer: 
-                            self.buzzer.play_tone("select")
+                    if key_value <= len(self.games):
+                        self.buzzer.play_tone("select")
                         self.current_selection = key_value - 1
                         self.state = GameState.INSTRUCTION
-                        if self.traffic_light: 
-                            self.traffic_light.yellow_on()
-                except ValueError:
-                    if key_pressed == 'D' and self.traffic_light:
-                        self.traffic_light.all_off()
+                        self.traffic_light.yellow_on()
+                elif key_pressed in self._menu_letter_actions:
+                    self._menu_letter_actions[key_pressed]()
 
         # Xbox控制器輸入
         if self.controller:
-            controller_input = self.controller.get_input()
+            controller_input = self._get_input_cached()
             if controller_input:
-                input_detected = False
+                up = controller_input["up_pressed"]
+                down = controller_input["down_pressed"]
+                delta = -1 if up else 1 if down else 0
                 
-                if controller_input["up_pressed"]:
-                    self.current_selection = (self.current_selection - 1 + len(self.games)) % len(self.games)
-                    input_detected = True
-                elif controller_input["down_pressed"]:
-                    self.current_selection = (self.current_selection + 1) % len(self.games)
-                    input_detected = True
+                if delta:
+                    self.current_selection = (self.current_selection + delta) % len(self.games)
+                    self.last_input_time = time.time()
+                    self.buzzer.play_tone("navigate")
                 elif controller_input["a_pressed"]:
-                    if self.buzzer: 
-                        self.buzzer.play_tone("select")
+                    self.buzzer.play_tone("select")
                     self.state = GameState.INSTRUCTION
-                    if self.traffic_light: 
-                        self.traffic_light.yellow_on()
-                    input_detected = True
-                
-                if input_detected:
+                    self.traffic_light.yellow_on()
                     self.last_input_time = time.time()
-                    if self.buzzer and controller_input["up_pressed"] or controller_input["down_pressed"]:
-                        self.buzzer.play_tone("navigate")
+
+    def _refresh_spi(self, content_key, draw, *args):
+        """節流 SPI 螢幕更新：內容未變或未到更新間隔時不傳輸"""
+        if not (self.spi_screen and self.spi_screen.device):
+            return
+        if content_key == self._spi_last_key:
+            return
+        now = pygame.time.get_ticks()
+        if now < self._spi_next_update:
+            return
+        draw(*args)
+        self._spi_last_key = content_key
+        self._spi_next_update = now + SPI_UPDATE_INTERVAL_MS
+
+    def _turn_off_traffic_light(self):
+        """關閉交通燈"""
+        self.traffic_light.all_off()
 
     def _handle_instruction(self):
         """處理說明狀態"""
         selected_game_data = self.games[self.current_selection]
-        if self.spi_screen and self.spi_screen.device:
-            self.spi_screen.display_game_instructions(selected_game_data)
+        self._refresh_spi((GameState.INSTRUCTION, self.current_selection),
+                          self.spi_screen.display_game_instructions if self.spi_screen else None,
+                          selected_game_data)
         
         if self._can_process_input():
             # 矩陣鍵盤輸入
             if self.keypad:
-                key_pressed = self.keypad.get_key()
+                key_pressed = self._get_key_cached()
                 if key_pressed == "A": 
                     self._start_game_sequence(selected_game_data)
                 elif key_pressed == "D": 
@@ -664,32 +1064,31 @@ class EnhancedGameConsole:
             
             # Xbox控制器輸入
             if self.controller:
-                controller_input = self.controller.get_input()
+                controller_input = self._get_input_cached()
                 if controller_input:
                     if controller_input["a_pressed"]:
                         self._start_game_sequence(selected_game_data)
                     elif controller_input["b_pressed"]:
                         self._return_to_menu()
 
-        if self.hdmi_screen:
-            self.hdmi_screen.fill((0, 0, 0))
+        # 說明畫面是靜態的，只在剛進入時繪製
+        render_key = (GameState.INSTRUCTION, self.current_selection)
+        if self.hdmi_screen and self._last_render_key != render_key:
             self._render_instructions_on_hdmi(selected_game_data)
             pygame.display.flip()
+            self._last_render_key = render_key
 
     def _start_game_sequence(self, game_data):
         """開始遊戲序列"""
-        if self.buzzer: 
-            self.buzzer.play_tone("game_start")
+        self.buzzer.play_tone("game_start")
         self.state = GameState.GAME_STARTING
         self.game_start_time = time.time()
         self.selected_game_data = game_data
 
     def _return_to_menu(self):
         """返回選單"""
-        if self.buzzer: 
-            self.buzzer.play_tone("back")
-        if self.traffic_light: 
-            self.traffic_light.all_off()
+        self.buzzer.play_tone("back")
+        self.traffic_light.all_off()
         self.state = GameState.MENU
 
     def _handle_game_starting(self):
@@ -700,47 +1099,84 @@ class EnhancedGameConsole:
             # 顯示倒數動畫
             countdown = 3 - int(elapsed / 0.5)
             if countdown > 0:
-                if self.traffic_light:
-                    if countdown == 3:
-                        self.traffic_light.red_on()
-                    elif countdown == 2:
-                        self.traffic_light.yellow_on()
-                    elif countdown == 1:
-                        self.traffic_light.green_on()
+                if countdown == 3:
+                    self.traffic_light.red_on()
+                elif countdown == 2:
+                    self.traffic_light.yellow_on()
+                elif countdown == 1:
+                    self.traffic_light.green_on()
                 
-                if self.buzzer and int(elapsed * 2) != getattr(self, '_last_beep', -1):
+                if int(elapsed * 2) != getattr(self, '_last_beep', -1):
                     self.buzzer.play_tone(frequency=300 + countdown * 200, duration=0.2)
                     self._last_beep = int(elapsed * 2)
         else:
             # 開始遊戲
             self._actually_start_game(self.selected_game_data)
 
+    def _get_game_class(self, game_data):
+        """取得遊戲類別，第一次使用時才載入其模組"""
+        game_class = self._game_classes.get(game_data.id)
+        if game_class is None:
+            module = importlib.import_module(game_data.module)
+            game_class = getattr(module, game_data.class_name)
+            self._game_classes[game_data.id] = game_class
+        return game_class
+
+    def _create_game(self, game_data):
+        """建立遊戲實例"""
+        game_class = self._get_game_class(game_data)
+        return game_class(
+            width=self.config.config["display"]["hdmi_width"],
+            height=self.config.config["display"]["hdmi_height"],
+            buzzer=self.buzzer
+        )
+
+    def _warm_all_games(self):
+        """背景線程：預先建立所有遊戲實例並執行其預載入"""
+        for game in self.games:
+            try:
+                instance = self._create_game(game)
+                preload = getattr(instance, "preload", None)
+                if preload:
+                    preload()
+                self._warm_games[game.id] = instance
+            except Exception as e:
+                logging.warning("預先建立遊戲 '%s' 失敗: %s", game.name, e)
+        logging.info("已預先建立 %s 個遊戲實例", len(self._warm_games))
+
     def _actually_start_game(self, game_data):
         """實際開始遊戲"""
         try:
-            game_class = game_data["game_class"]
-            self.current_game = game_class(
-                width=self.config.config["display"]["hdmi_width"],
-                height=self.config.config["display"]["hdmi_height"],
-                buzzer=self.buzzer
-            )
+            game = self._warm_games.pop(game_data.id, None)
+            if game is not None:
+                # 預建實例的計時器從建立時開始，重置以從現在起算
+                game.reset_game()
+            else:
+                game = self._create_game(game_data)
+            
+            # 遊戲可提供 warmup()，在第一幀之前於主線程預先建立資源
+            warmup = getattr(game, "warmup", None)
+            if warmup:
+                warmup()
+            self.current_game = game
             self.state = GameState.GAME
             self.session_stats["games_played"] += 1
             
             if self.spi_screen and self.spi_screen.device:
                 self.spi_screen.clear_screen()
+                self._spi_last_key = None
             
-            logging.info(f"遊戲 '{game_data['name']}' 已啟動")
+            logging.info("遊戲 '%s' 已啟動", game_data.name)
             
         except Exception as e:
-            logging.error(f"啟動遊戲 '{game_data['name']}' 失敗: {e}")
+            logging.error("啟動遊戲 '%s' 失敗: %s", game_data.name, e)
             self._show_error_message(f"遊戲啟動失敗: {str(e)}")
             self.state = GameState.MENU
 
     def _handle_game(self):
         """處理遊戲狀態"""
         if self.current_game is not None:
-            controller_input = self.controller.get_input() if self.controller else {}
+            controller_input = self._get_input_cached() if self.controller else {}
             game_status = self.current_game.update(controller_input)
             
             if game_status.get("game_over", False):
@@ -751,76 +1187,88 @@ class EnhancedGameConsole:
                 score = game_status.get("score", 0)
                 self.session_stats["total_score"] += score
                 
-                game_name = self.games[self.current_selection]["name"]
-                if game_name not in self.session_stats["best_scores"]:
-                    self.session_stats["best_scores"][game_name] = score
-                else:
-                    self.session_stats["best_scores"][game_name] = max(
-                        self.session_stats["best_scores"][game_name], score
-                    )
+                game_name = self.games[self.current_selection].name
+                best_scores = self.session_stats["best_scores"]
+                best_scores[game_name] = max(best_scores.get(game_name, score), score)
                 
             elif self.hdmi_screen:
-                self.current_game.render(self.hdmi_screen)
-                pygame.display.flip()
+                game = self.current_game
+                get_dirty_rects = getattr(game, "get_dirty_rects", None)
+                if get_dirty_rects and self._last_render_key is not None:
+                    # 畫面剛被選單/暫停等畫面覆蓋，要求遊戲完整重繪
+                    game.invalidate_render()
+                
+                game.render(self.hdmi_screen)
+                
+                # 支援髒矩形的遊戲只更新變動區域，None 表示整個畫面
+                self._present(get_dirty_rects() if get_dirty_rects else None)
 
     def _handle_game_paused(self):
         """處理遊戲暫停狀態"""
-        # 顯示暫停畫面
-        if self.hdmi_screen:
+        # 暫停畫面是靜態的，只在剛進入時繪製
+        if self.hdmi_screen and self._last_render_key != (GameState.GAME_PAUSED,):
             self.hdmi_screen.fill((0, 0, 0))
-            font = pygame.font.Font(None, 72)
-            text = font.render("遊戲已暫停", True, (255, 255, 255))
+            text = self._static_text['paused']
             rect = text.get_rect(center=(self.hdmi_screen.get_width()//2, self.hdmi_screen.get_height()//2))
             self.hdmi_screen.blit(text, rect)
             
-            hint_font = pygame.font.Font(None, 36)
-            hint_text = hint_font.render("按電源按鈕繼續", True, (200, 200, 200))
+            hint_text = self._static_text['paused_hint']
             hint_rect = hint_text.get_rect(center=(self.hdmi_screen.get_width()//2, self.hdmi_screen.get_height()//2 + 100))
             self.hdmi_screen.blit(hint_text, hint_rect)
             
             pygame.display.flip()
+            self._last_render_key = (GameState.GAME_PAUSED,)
 
     def _handle_game_over(self):
         """處理遊戲結束狀態"""
-        if not hasattr(self, '_game_over_start_time'):
-            self._game_over_start_time = time.time()
+        if self.game_over_deadline is None:
+            self.game_over_deadline = pygame.time.get_ticks() + 3000
+            
+            # 保留遊戲最後一幀畫面
+            if self.hdmi_screen and self.current_game:
+                self.current_game.render(self.hdmi_screen)
+                pygame.display.flip()
+            self._last_render_key = (GameState.GAME_OVER,)
             
-            if self.buzzer: 
-                self.buzzer.play_tone("game_over")
-            if self.traffic_light: 
-                self.traffic_light.red_on()
+            self.buzzer.play_tone("game_over")
+            self.traffic_light.red_on()
             
             if self.spi_screen and self.spi_screen.device:
                 self.spi_screen.display_game_over(
                     self.game_over_data.get("score", 0),
-                    self.session_stats["best_scores"].get(self.games[self.current_selection]["name"])
+                    self.session_stats["best_scores"].get(self.games[self.current_selection].name)
                 )
+                self._spi_last_key = None
             
-            logging.info(f"遊戲結束，分數: {self.game_over_data.get('score', 0)}")
+            logging.info("遊戲結束，分數: %s", self.game_over_data.get('score', 0))
         
-        # 3秒後自動返回選單
-        if time.time() - self._game_over_start_time > 3:
+        # 3秒後自動返回選單（期間主循環照常處理事件）
+        if pygame.time.get_ticks() >= self.game_over_deadline:
             self.end_current_game()
             self.state = GameState.MENU
-            if self.traffic_light: 
-                self.traffic_light.all_off()
-            delattr(self, '_game_over_start_time')
+            self.traffic_light.all_off()
+            self.game_over_deadline = None
 
     def _handle_error(self):
         """處理錯誤狀態"""
-        if self.hdmi_screen:
+        # 錯誤畫面是靜態的，只在剛進入時繪製
+        if self.hdmi_screen and self._last_render_key != (GameState.ERROR,):
             self.hdmi_screen.fill((50, 0, 0))  # 深紅色背景
-            font = pygame.font.Font(None, 48)
-            text = font.render("系統錯誤", True, (255, 255, 255))
+            text = self._static_text['error']
             rect = text.get_rect(center=(self.hdmi_screen.get_width()//2, self.hdmi_screen.get_height()//2))
             self.hdmi_screen.blit(text, rect)
             pygame.display.flip()
+            self._last_render_key = (GameState.ERROR,)
         
-        time.sleep(0.1)  # 避免錯誤狀態下的快速循環
+        # 在 SDL 內阻塞等待事件（最多 500ms），收到的事件交由本幀的事件處理
+        if not self.frame_events:
+            event = pygame.event.wait(500)
+            if event.type != pygame.NOEVENT:
+                self.frame_events.append(event)
 
-    def _handle_pygame_events(self):
-        """處理Pygame事件"""
-        for event in pygame.event.get():
+    def _handle_pygame_events(self, events):
+        """處理本幀已抽取的Pygame事件"""
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -831,40 +1279,48 @@ class EnhancedGameConsole:
                         self.running = False
                 elif event.key == pygame.K_F1:
                     # 切換除錯資訊顯示
-                    self.config.config["debug"]["show_fps"] = not self.config.config["debug"]["show_fps"]
+                    self._show_fps = not self._show_fps
+                    self.config.config["debug"]["show_fps"] = self._show_fps
 
     def _render_debug_info(self):
-        """渲染除錯資訊"""
+        """渲染除錯資訊，返回繪製範圍"""
         if not self.hdmi_screen:
-            return
+            return None
         
-        font = pygame.font.Font(None, 24)
         y_offset = 10
+        rects = []
         
         # FPS
         avg_fps = self.performance_monitor.get_average_fps()
-        fps_text = font.render(f"FPS: {avg_fps:.1f}", True, (255, 255, 255))
-        self.hdmi_screen.blit(fps_text, (10, y_offset))
+        fps_text = self._render_text('info', f"FPS: {avg_fps:.1f}", (255, 255, 255))
+        rects.append(self.hdmi_screen.blit(fps_text, (10, y_offset)))
         y_offset += 25
         
         # 系統資源
-        cpu_text = font.render(f"CPU: {self.performance_monitor.cpu_usage:.1f}%", True, (255, 255, 255))
-        self.hdmi_screen.blit(cpu_text, (10, y_offset))
+        cpu_text = self._render_text(
+            'info',
+            f"CPU: {self.performance_monitor.cpu_usage:.1f}% (Proc {self.performance_monitor.process_cpu_usage:.1f}%)",
+            (255, 255, 255)
+        )
+        rects.append(self.hdmi_screen.blit(cpu_text, (10, y_offset)))
         y_offset += 25
         
-        memory_text = font.render(f"Memory: {self.performance_monitor.memory_usage:.1f}%", True, (255, 255, 255))
-        self.hdmi_screen.blit(memory_text, (10, y_offset))
+        memory_text = self._render_text('info', f"Memory: {self.performance_monitor.memory_usage:.1f}%", (255, 255, 255))
+        rects.append(self.hdmi_screen.blit(memory_text, (10, y_offset)))
         y_offset += 25
         
         if self.performance_monitor.temperature > 0:
-            temp_text = font.render(f"Temp: {self.performance_monitor.temperature:.1f}°C", True, (255, 255, 255))
-            self.hdmi_screen.blit(temp_text, (10, y_offset))
+            temp_text = self._render_text('info', f"Temp: {self.performance_monitor.temperature:.1f}°C", (255, 255, 255))
+            rects.append(self.hdmi_screen.blit(temp_text, (10, y_offset)))
+        
+        return rects[0].unionall(rects[1:])
 
     def _show_error_message(self, message):
         """顯示錯誤訊息"""
         logging.error(message)
         if self.spi_screen and self.spi_screen.device:
             self.spi_screen.display_custom_message("錯誤", message, duration=3)
+            self._spi_last_key = None
 
     def _render_menu_on_hdmi(self):
         """在HDMI螢幕上渲染選單"""
@@ -872,38 +1328,61 @@ class EnhancedGameConsole:
         if not self.hdmi_screen: 
             return
         
-        font_title = pygame.font.Font(None, 72)
-        font_item = pygame.font.Font(None, 48)
-        font_info = pygame.font.Font(None, 24)
+        # 統計資訊改變時才重建選單背景
+        stats_text = f"本次遊玩: {self.session_stats['games_played']} 場 | 總分: {self.session_stats['total_score']}"
+        if self._menu_bg_surface is None or self._stats_cache[0] != stats_text:
+            self._stats_cache = (stats_text, self._prerender('info', stats_text, (150, 150, 150)))
+            self._rebuild_menu_bg()
+        
+        self.hdmi_screen.blit(self._menu_bg_surface, (0, 0))
+        self._redraw_menu_item(self.current_selection)
+
+    def _rebuild_menu_bg(self):
+        """將標題、所有未選中項目與統計資訊預先繪製到離屏表面"""
+        bg = pygame.Surface((HDMI_SCREEN_WIDTH, HDMI_SCREEN_HEIGHT)).convert()
+        bg.fill((0, 0, 0))
         
         # 標題
-        title_surface = font_title.render(f"多功能遊戲機 v{VERSION}", True, (255, 255, 255))
-        self.hdmi_screen.blit(title_surface, (HDMI_SCREEN_WIDTH // 2 - title_surface.get_width() // 2, 50))
+        title_surface = self._title_surface
+        blits = [(title_surface, (_center_x(title_surface), 50))]
         
         # 遊戲列表
-        for i, game in enumerate(self.games):
-            color = (255, 255, 0) if i == self.current_selection else (200, 200, 200)
+        for i in range(len(self.games)):
             y_pos = 150 + i * 45
-            
-            # 遊戲名稱
-            item_surface = font_item.render(f"{game['id']}. {game['name']}", True, color)
-            self.hdmi_screen.blit(item_surface, (50, y_pos))
-            
-            # 難度指示
-            difficulty_color = {
-                "Easy": (0, 255, 0),
-                "Medium": (255, 255, 0),
-                "Hard": (255, 0, 0)
-            }.get(game.get("difficulty", "Medium"), (255, 255, 255))
-            
-            diff_surface = font_info.render(f"[{game.get('difficulty', 'Medium')}]", True, difficulty_color)
-            self.hdmi_screen.blit(diff_surface, (600, y_pos + 10))
+            blits.append((self._menu_surfaces[i][1], (50, y_pos)))
+            blits.append((self._menu_diff_surfaces[i], (600, y_pos + 10)))
         
         # 統計資訊
-        stats_y = HDMI_SCREEN_HEIGHT - 100
-        stats_text = f"本次遊玩: {self.session_stats['games_played']} 場 | 總分: {self.session_stats['total_score']}"
-        stats_surface = font_info.render(stats_text, True, (150, 150, 150))
-        self.hdmi_screen.blit(stats_surface, (50, stats_y))
+        blits.append((self._stats_cache[1], (50, HDMI_SCREEN_HEIGHT - 100)))
+        
+        # 一次呼叫完成所有文字的繪製
+        bg.blits(blits, doreturn=0)
+        self._menu_bg_surface = bg
+
+    def _rebuild_menu_highlight(self):
+        """繪製目前選中項目的高亮列"""
+        index = self.current_selection
+        row = pygame.Surface((HDMI_SCREEN_WIDTH, 45)).convert()
+        row.fill((0, 0, 0))
+        row.blit(self._menu_surfaces[index][0], (50, 0))
+        row.blit(self._menu_diff_surfaces[index], (600, 10))
+        
+        self._menu_highlight_surface = row
+        self._menu_highlight_index = index
+
+    def _redraw_menu_item(self, index):
+        """重繪單一選單項目，返回需要更新的區域"""
+        y_pos = 150 + index * 45
+        item_rect = pygame.Rect(0, y_pos, HDMI_SCREEN_WIDTH, 45)
+        
+        if index == self.current_selection:
+            if self._menu_highlight_index != index:
+                self._rebuild_menu_highlight()
+            self.hdmi_screen.blit(self._menu_highlight_surface, item_rect)
+        else:
+            # 從背景還原未選中的樣子
+            self.hdmi_screen.blit(self._menu_bg_surface, item_rect, item_rect)
+        return item_rect
 
     def _render_instructions_on_hdmi(self, game_data):
         """在HDMI螢幕上渲染遊戲說明"""
@@ -911,38 +1390,20 @@ class EnhancedGameConsole:
         if not self.hdmi_screen: 
             return
         
-        font_title = pygame.font.Font(None, 72)
-        font_text = pygame.font.Font(None, 36)
-        font_hint = pygame.font.Font(None, 48)
-
-        title_surface = font_title.render(game_data["name"], True, (255, 255, 255))
-        self.hdmi_screen.blit(title_surface, (HDMI_SCREEN_WIDTH // 2 - title_surface.get_width() // 2, 100))
-        
-        # 難度顯示
-        difficulty = game_data.get("difficulty", "Medium")
-        diff_color = {
-            "Easy": (0, 255, 0),
-            "Medium": (255, 255, 0),
-            "Hard": (255, 0, 0)
-        }.get(difficulty, (255, 255, 255))
+        surface = self._instr_cache.get(game_data.id)
+        if surface is None:
+            surface = pygame.Surface((HDMI_SCREEN_WIDTH, HDMI_SCREEN_HEIGHT)).convert()
+            surface.fill((0, 0, 0))
+            surface.blits(self._build_instruction_surfaces(game_data), doreturn=0)
+            self._instr_cache[game_data.id] = surface
         
-        diff_surface = font_text.render(f"難度: {difficulty}", True, diff_color)
-        self.hdmi_screen.blit(diff_surface, (HDMI_SCREEN_WIDTH // 2 - diff_surface.get_width() // 2, 160))
-        
-        # 遊戲說明
-        desc_lines = game_data["description"].split('。')
-        y_offset = 0
-        for line in desc_lines:
-            if line.strip():
-                desc_surface = font_text.render(line.strip() + "。", True, (200, 200, 200))
-                self.hdmi_screen.blit(desc_surface, (HDMI_SCREEN_WIDTH // 2 - desc_surface.get_width() // 2, 220 + y_offset))
-                y_offset += 40
-
-        hint_surface = font_hint.render("按 A/確認 開始遊戲 或 B/返回 返回選單", True, (150, 150, 150))
-        self.hdmi_screen.blit(hint_surface, (HDMI_SCREEN_WIDTH // 2 - hint_surface.get_width() // 2, HDMI_SCREEN_HEIGHT - 100))
+        self.hdmi_screen.blit(surface, (0, 0))
 
     def end_current_game(self):
         """結束當前遊戲"""
+        # 遊戲、載入與結束畫面期間不會取出矩陣鍵盤按鍵，回到選單前先清掉
+        if self.keypad:
+            self.keypad.clear()
         if self.current_game:
             if hasattr(self.current_game, 'cleanup'):
                 self.current_game.cleanup()
@@ -953,30 +1414,27 @@ class EnhancedGameConsole:
         """錯誤時的清理"""
         logging.info("執行錯誤清理...")
         
-        if self.spi_screen: 
-            self.spi_screen.cleanup()
-        if self.keypad: 
-            self.keypad.cleanup()
-        if self.controller: 
-            self.controller.cleanup()
-        if self.buzzer: 
-            self.buzzer.cleanup()
-        if self.traffic_light: 
-            self.traffic_light.cleanup()
-        if self.power_button:
-            self.power_button.cleanup()
+        for name, component in self._hw_registry:
+            if component:
+                self._safe_cleanup(component, name)
         if pygame.get_init(): 
             pygame.quit()
 
     def cleanup(self):
         """清理資源 - 增強版"""
+        # run() 結束與 __main__ 的 finally 都會呼叫，只需執行一次
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
         logging.info("開始系統清理...")
         
         # 停止系統監控
         if self.monitor_running:
             self.monitor_running = False
+            self._monitor_stop.set()
             if self.monitor_thread and self.monitor_thread.is_alive():
                 self.monitor_thread.join(timeout=2)
+        self.performance_monitor.close()
         
         # 結束當前遊戲
         if self.current_game:
@@ -987,89 +1445,85 @@ class EnhancedGameConsole:
             self.config.save_config()
             self._save_session_stats()
         except Exception as e:
-            logging.error(f"儲存數據失敗: {e}")
+            logging.error("儲存數據失敗: %s", e)
         
         # 清理硬體組件
-        hardware_components = [
-            (self.spi_screen, "SPI螢幕"),
-            (self.keypad, "矩陣鍵盤"),
-            (self.controller, "Xbox控制器"),
-            (self.buzzer, "蜂鳴器"),
-            (self.traffic_light, "交通燈"),
-            (self.power_button, "電源按鈕")
-        ]
-        
-        for component, name in hardware_components:
-            if component:
-                try:
-                    component.cleanup()
-                    logging.info(f"{name} 清理完成")
-                except Exception as e:
-                    logging.error(f"{name} 清理失敗: {e}")
+        # 各組件的清理多半阻塞在 I/O 上，平行執行讓總時間取決於最慢的一個
+        active = [(component, name) for name, component in self._hw_registry if component]
+        if active:
+            executor = ThreadPoolExecutor(max_workers=len(active))
+            futures = [executor.submit(self._safe_cleanup, component, name)
+                       for component, name in active]
+            _, pending = wait(futures, timeout=5)
+            if pending:
+                logging.warning("%s 個硬體組件清理逾時", len(pending))
+            # 逾時的組件不再等待，避免卡住關機流程
+            executor.shutdown(wait=not pending)
         
-        # 清理Pygame
+        # 清理Pygame（非執行緒安全，留在主線程）
         if pygame.get_init():
             pygame.quit()
             logging.info("Pygame 已關閉")
         
         logging.info("遊戲機系統清理完成")
 
+    @staticmethod
+    def _safe_cleanup(component, name):
+        """清理單一硬體組件並記錄結果"""
+        try:
+            component.cleanup()
+            logging.info("%s 清理完成", name)
+        except Exception as e:
+            logging.error("%s 清理失敗: %s", name, e)
+
     def _save_session_stats(self):
-        """儲存會話統計數據"""
+        """以附加一行 JSON 的方式儲存會話統計數據"""
         try:
-            stats_file = os.path.join(os.path.dirname(__file__), 'session_stats.json')
-            
-            # 載入現有統計數據
-            all_stats = {}
-            if os.path.exists(stats_file):
-                with open(stats_file, 'r', encoding='utf-8') as f:
-                    all_stats = json.load(f)
+            stats_file = _STATS_FILE
             
-            # 新增本次會話數據
-            session_id = self.session_stats["start_time"].strftime("%Y%m%d_%H%M%S")
-            all_stats[session_id] = {
-                "start_time": self.session_stats["start_time"].isoformat(),
+            session_id = self._session_id
+            record = {
+                "session_id": session_id,
+                "start_time": self._session_start_iso,
                 "end_time": datetime.now().isoformat(),
                 "games_played": self.session_stats["games_played"],
                 "total_score": self.session_stats["total_score"],
                 "best_scores": self.session_stats["best_scores"]
             }
             
-            # 只保留最近30次會話
-            if len(all_stats) > 30:
-                sorted_sessions = sorted(all_stats.keys())
-                for old_session in sorted_sessions[:-30]:
-                    del all_stats[old_session]
+            if ORJSON_AVAILABLE:
+                line = orjson.dumps(record) + b"\n"
+            else:
+                line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+            
+            with open(stats_file, 'ab', buffering=65536) as f:
+                f.write(line)
             
-            # 儲存統計數據
-            with open(stats_file, 'w', encoding='utf-8') as f:
-                json.dump(all_stats, f, indent=2, ensure_ascii=False)
+            # 檔案過大時才移除舊會話
+            if os.path.getsize(stats_file) > STATS_COMPACT_BYTES:
+                self._compact_stats(stats_file)
                 
-            logging.info(f"會話統計已儲存: {session_id}")
+            logging.info("會話統計已儲存: %s", session_id)
             
         except Exception as e:
-            logging.error(f"儲存統計數據失敗: {e}")
+            logging.error("儲存統計數據失敗: %s", e)
+
+    def _compact_stats(self, stats_file):
+        """只保留最近 STATS_KEEP_SESSIONS 次會話，以原子方式覆寫統計檔"""
+        with open(stats_file, 'rb') as f:
+            recent = collections.deque(f, maxlen=STATS_KEEP_SESSIONS)
+        
+        tmp_file = stats_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.writelines(recent)
+        os.replace(tmp_file, stats_file)
 
 # 主程式入口
 if __name__ == "__main__":
-    power_button_process = None
     game_console_instance = None
     
     try:
-        # 啟動電源按鈕監控
-        main_pid = str(os.getpid())
-        power_button_script_path = os.path.join(os.path.dirname(__file__), "power_button.py")
-        
-        if os.path.exists(power_button_script_path):
-            logging.info(f"嘗試啟動 power_button.py (PID: {main_pid})...")
-            power_button_process = subprocess.Popen(
-                ['sudo', 'python3', power_button_script_path, main_pid],
-                preexec_fn=os.setpgrp
-            )
-            logging.info(f"power_button.py 已在背景啟動 (子程序 PID: {power_button_process.pid})")
-        else:
-            logging.warning(f"警告: power_button.py 未找到: {power_button_script_path}")
-
+        # 電源按鈕由 GameControlButton 在程序內監控（見 _init_power_button）
         # 啟動遊戲機
         game_console_instance = EnhancedGameConsole()
         game_console_instance.run()
@@ -1077,25 +1531,13 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logging.info("主程式被使用者中斷 (Ctrl+C)")
     except Exception as e:
-        logging.error(f"主程式發生未預期錯誤: {e}")
-        logging.error(traceback.format_exc())
+        logging.exception("主程式發生未預期錯誤: %s", e)
     finally:
         logging.info("主程式 finally 區塊開始執行清理...")
         
         if game_console_instance:
             game_console_instance.cleanup()
         
-        # 終止電源按鈕程序
-        if power_button_process:
-            try:
-                os.killpg(os.getpgid(power_button_process.pid), signal.SIGTERM)
-                power_button_process.wait(timeout=2)
-                logging.info("power_button.py 子程序已終止")
-            except (ProcessLookupError, subprocess.TimeoutExpired) as e:
-                logging.warning(f"終止 power_button.py 時發生問題: {e}")
-            except Exception as e:
-                logging.error(f"終止 power_button.py 時發生錯誤: {e}")
-        
         # 最終GPIO清理
         if GPIO.getmode() is not None:
             logging.info("執行最終的 GPIO.cleanup()...")
@@ -3,6 +3,8 @@
 # matrix_keypad.py - 矩陣鍵盤控制邏輯
 
 import time
+import queue
+import logging
 import RPi.GPIO as GPIO
 
 # 定義鍵盤的 GPIO 引腳 (請根據實際連接調整)
@@ -36,6 +38,17 @@ class MatrixKeypad:
         self.key_map = key_map
         self.last_key_press_time = 0
         self.last_key = None
+        
+        # 預先算好各列掃描時的輸出電平，一次 GPIO.output 寫入所有列
+        self._all_high = [GPIO.HIGH] * len(col_pins)
+        self._scan_levels = [
+            [GPIO.LOW if i == col_idx else GPIO.HIGH for i in range(len(col_pins))]
+            for col_idx in range(len(col_pins))
+        ]
+        
+        # 中斷模式下由 GPIO 事件線程放入按鍵，get_key 只需取出
+        self.interrupt_mode = False
+        self._key_queue = queue.Queue()
         self._setup()
     
     def _setup(self):
@@ -45,17 +58,69 @@ class MatrixKeypad:
             # GPIO.setmode(GPIO.BCM)  # 使用 BCM 模式，在主程式中已設置
             
             # 設置列為輸出，行為輸入
-            for pin in self.col_pins:
-                GPIO.setup(pin, GPIO.OUT)
-                GPIO.output(pin, GPIO.HIGH)  # 預設為高電平
+            GPIO.setup(self.col_pins, GPIO.OUT)
+            GPIO.output(self.col_pins, self._all_high)  # 預設為高電平
             
             for pin in self.row_pins:
                 GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)  # 設置上拉電阻
             
-            print("矩陣鍵盤初始化成功")
+            self._enable_interrupts()
+            
+            logging.info("矩陣鍵盤初始化成功")
         
         except Exception as e:
-            print(f"矩陣鍵盤初始化失敗: {e}")
+            logging.error("矩陣鍵盤初始化失敗: %s", e)
+    
+    def _enable_interrupts(self):
+        """所有列保持低電平並在行引腳註冊下降緣偵測；失敗時改回輪詢掃描"""
+        try:
+            GPIO.output(self.col_pins, GPIO.LOW)
+            for pin in self.row_pins:
+                GPIO.add_event_detect(pin, GPIO.FALLING, callback=self._on_row_edge,
+                                      bouncetime=int(DEBOUNCE_DELAY * 1000))
+            self.interrupt_mode = True
+        except RuntimeError as e:
+            logging.warning("無法啟用邊緣偵測，改用輪詢掃描: %s", e)
+            self._disable_interrupts()
+            GPIO.output(self.col_pins, self._all_high)
+    
+    def _disable_interrupts(self):
+        """移除行引腳的邊緣偵測"""
+        for pin in self.row_pins:
+            try:
+                GPIO.remove_event_detect(pin)
+            except RuntimeError:
+                pass
+        self.interrupt_mode = False
+    
+    def _on_row_edge(self, row_pin):
+        """行引腳下降緣回呼（在 GPIO 事件線程中執行）"""
+        key = self._identify_key(row_pin)
+        if key is not None:
+            self._key_queue.put(key)
+    
+    def _identify_key(self, row_pin):
+        """
+        逐一將列拉高，找出讓該行恢復高電平的列
+        
+        返回:
+            按下的鍵值，若按鍵已放開或仍在彈跳則返回 None
+        """
+        row_idx = self.row_pins.index(row_pin)
+        gpio_input = GPIO.input
+        gpio_output = GPIO.output
+        low = GPIO.LOW
+        high = GPIO.HIGH
+        for col_idx, col_pin in enumerate(self.col_pins):
+            # 所有列皆為低電平時該行必須仍為低電平，否則按鍵已放開，不能把第一列誤判為按下
+            if gpio_input(row_pin) != low:
+                return None
+            gpio_output(col_pin, high)
+            released = gpio_input(row_pin) == high
+            gpio_output(col_pin, low)
+            if released:
+                return self.key_map[row_idx][col_idx]
+        return None
     
     def get_key_raw(self):
         """
@@ -64,29 +129,33 @@ class MatrixKeypad:
         返回:
             按下的鍵值，若無按鍵按下則返回 None
         """
+        # 輪詢模式下每次呼叫都會執行，迴圈內用到的全域與屬性先綁定為區域變數
+        gpio_output = GPIO.output
+        gpio_input = GPIO.input
+        low = GPIO.LOW
+        col_pins = self.col_pins
+        row_pins = self.row_pins
+        
         try:
-            # 掃描每一列
-            for col_idx, col_pin in enumerate(self.col_pins):
-                # 設置當前列為低電平
-                GPIO.output(col_pin, GPIO.LOW)
+            key = None
+            # 掃描每一列：一次寫入所有列，只有當前列為低電平
+            for col_idx, levels in enumerate(self._scan_levels):
+                gpio_output(col_pins, levels)
                 
-                # 檢查每一行
-                for row_idx, row_pin in enumerate(self.row_pins):
-                    # 若偵測到低電平，表示該位置上的按鍵被按下
-                    if GPIO.input(row_pin) == GPIO.LOW:
-                        # 恢復該列為高電平
-                        GPIO.output(col_pin, GPIO.HIGH)
-                        # 返回按下的鍵
-                        return self.key_map[row_idx][col_idx]
-                
-                # 恢復該列為高電平
-                GPIO.output(col_pin, GPIO.HIGH)
+                # 一次讀取所有行，低電平表示該位置上的按鍵被按下
+                states = [gpio_input(row_pin) for row_pin in row_pins]
+                if low in states:
+                    key = self.key_map[states.index(low)][col_idx]
+                    break
+            
+            # 掃描結束後一次恢復所有列為高電平
+            gpio_output(col_pins, self._all_high)
             
             # 若無按鍵被按下，返回 None
-            return None
+            return key
         
         except Exception as e:
-            print(f"鍵盤掃描錯誤: {e}")
+            logging.error("鍵盤掃描錯誤: %s", e)
             return None
     
     def get_key(self):
@@ -96,6 +165,12 @@ class MatrixKeypad:
         返回:
             按下的鍵值，若無按鍵按下則返回 None
         """
+        if self.interrupt_mode:
+            # 每幀都會呼叫且多半沒有按鍵，先檢查是否為空以免拋出例外；只有主循環取出，不會被搶走
+            if self._key_queue.empty():
+                return None
+            return self._key_queue.get_nowait()
+        
         current_time = time.time()
         
         # 檢查是否超過防彈跳延遲
@@ -119,6 +194,15 @@ class MatrixKeypad:
         
         return None
     
+    def clear(self):
+        """丟棄尚未取出的按鍵，避免遊戲中按下的鍵在回到選單後才被處理"""
+        try:
+            while True:
+                self._key_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self.last_key = None
+    
     def wait_for_key(self, timeout=None):
         """
         等待直到有按鍵被按下或超時
@@ -129,6 +213,12 @@ class MatrixKeypad:
         返回:
             按下的鍵值，若超時則返回 None
         """
+        if self.interrupt_mode:
+            try:
+                return self._key_queue.get(timeout=timeout)
+            except queue.Empty:
+                return None
+        
         start_time = time.time()
         
         while timeout is None or time.time() - start_time < timeout:
@@ -142,10 +232,15 @@ class MatrixKeypad:
     def cleanup(self):
         """清理 GPIO 資源"""
         # GPIO.cleanup() 將在主程式中處理
-        print("矩陣鍵盤資源已清理")
+        if self.interrupt_mode:
+            self._disable_interrupts()
+        logging.info("矩陣鍵盤資源已清理")
 
 # 測試代碼
 if __name__ == "__main__":
+    # 獨立執行時讓類別中的日誌直接輸出到終端
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     try:
         # 設置 GPIO 模式
         GPIO.setmode(GPIO.BCM)
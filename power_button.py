@@ -3,39 +3,83 @@
 # power_button_fixed.py - 修正版遊戲控制按鈕程式
 
 import RPi.GPIO as GPIO
+import os
+import sys
+import mmap
+import struct
 import time
+import logging
 import threading
-import queue
-from datetime import datetime
+import collections
 
 # GPIO 設定
 POWER_BUTTON_PIN = 22
 HOLD_DURATION = 3.0      # 長按持續時間（秒）
 SHORT_PRESS_MIN = 0.05   # 短按最小時間（秒）
-DEBOUNCE_TIME = 0.02     # 去彈跳時間（秒）
+BOUNCE_TIME_MS = 50      # 邊緣偵測的去彈跳時間（毫秒），由 RPi.GPIO 在 C 層過濾
+EVENT_QUEUE_SIZE = 64    # 事件佇列上限，超過時捨棄最舊的事件
+HOLD_TIMER_CPU = 3       # 長按計時執行緒固定的 CPU 核心（建議以 isolcpus=3 隔離）
+HOLD_TIMER_RT_PRIORITY = 20  # 長按計時執行緒的 SCHED_FIFO 優先權
+
+# GPIO 暫存器直接讀取（BCM2835/2711 的 /dev/gpiomem），GPLEV0 記錄 GPIO 0–31 的電平
+GPIOMEM_PATH = '/dev/gpiomem'
+GPLEV0_OFFSET = 0x34
+
+# 按鈕事件：固定欄位的 namedtuple，比每次建立 dict 更省記憶體
+ButtonEvent = collections.namedtuple('ButtonEvent', ['type', 'action', 'timestamp'])
+_SHORT_PRESS = ('short_press', 'toggle_pause')
+_LONG_PRESS = ('long_press', 'return_to_menu')
+
+
+class _HoldTimer(threading.Timer):
+    """長按計時器：等待前先切換為即時排程，避免系統負載拖慢長按判定"""
+    
+    def run(self):
+        try:
+            os.sched_setaffinity(0, {HOLD_TIMER_CPU})
+        except (OSError, AttributeError):
+            pass
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(HOLD_TIMER_RT_PRIORITY))
+        except (OSError, AttributeError):
+            # 需要 root 或 CAP_SYS_NICE，否則維持一般排程
+            pass
+        super().run()
+
 
 class GameControlButton:
-    """遊戲控制按鈕類別"""
+    """
+    遊戲控制按鈕類別
+    
+    長按計時執行緒會嘗試固定在 HOLD_TIMER_CPU 並使用 SCHED_FIFO；
+    若要完全避開其他工作的干擾，可在 /boot/cmdline.txt 加上 isolcpus=3
+    """
+    
+    # GPIO 電平對應的顯示名稱
+    _STATE_NAMES = {GPIO.HIGH: 'HIGH', GPIO.LOW: 'LOW'}
     
     def __init__(self, main_console_instance=None):
-        self.main_console = main_console_instance
+        self.main_console = main_console_instance  # 事件一律經由 event_queue 交給主循環處理，不在回呼線程中修改主控台
         self.running = False
-        self.monitor_thread = None
+        self._hold_timer = None  # 按下後啟動，到達長按時間仍未放開即觸發長按
+        self._hold_thread = None  # 正在執行長按處理的執行緒，停止監控時需等它結束
+        self._cleaned_up = False
         
         # 按鈕狀態追蹤
-        self.last_press_time = 0
-        self.button_pressed_duration = 0
+        self.last_press_time = 0  # time.monotonic() 值，不受系統校時影響
         self.was_pressed = False
-        self.last_button_state = GPIO.HIGH  # 預設狀態為 HIGH（未按下）
+        self._long_press_fired = False  # 本次按壓已觸發長按，放開時不再判斷短按
         
         # 事件計數器
         self.short_press_count = 0
         self.long_press_count = 0
         
         # 事件佇列，用於與主程式通訊
-        self.event_queue = queue.Queue()
+        # 由 GPIO 回呼與長按計時器放入、主循環取出；deque 的 append/popleft 本身即為原子操作，不需鎖
+        self.event_queue = collections.deque(maxlen=EVENT_QUEUE_SIZE)
         
         # 設定 GPIO
+        self._gpiomem = None  # 可用時改為直接讀取暫存器的 mmap
         self.setup_gpio()
     
     def setup_gpio(self):
@@ -46,77 +90,125 @@ class GameControlButton:
             
             # 修正：使用上拉電阻，按鈕一端接 GPIO，另一端接 GND
             GPIO.setup(POWER_BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            self._gpiomem = self._open_gpiomem()
             
-            print(f"✓ 遊戲控制按鈕 GPIO {POWER_BUTTON_PIN} 設定完成")
-            print("📋 正確接線方式：")
-            print(f"  • 按鈕一端 → GPIO {POWER_BUTTON_PIN} (Pin 15)")
-            print(f"  • 按鈕另一端 → GND (任一 GND 腳位)")
-            print("📍 邏輯：未按下=HIGH，按下=LOW")
+            logging.info("✓ 遊戲控制按鈕 GPIO %s 設定完成", POWER_BUTTON_PIN)
+            logging.info("📋 正確接線方式：")
+            logging.info("  • 按鈕一端 → GPIO %s (Pin 15)", POWER_BUTTON_PIN)
+            logging.info("  • 按鈕另一端 → GND (任一 GND 腳位)")
+            logging.info("📍 邏輯：未按下=HIGH，按下=LOW")
             return True
             
         except Exception as e:
-            print(f"✗ GPIO 設定失敗: {e}")
+            logging.error("✗ GPIO 設定失敗: %s", e)
             return False
     
+    @staticmethod
+    def _open_gpiomem():
+        """
+        映射 GPIO 暫存器，讀取電平時不需經過系統呼叫
+        
+        返回:
+            mmap 物件；裝置不存在或讀值與 RPi.GPIO 不一致（如 Pi 5）時返回 None
+        """
+        try:
+            fd = os.open(GPIOMEM_PATH, os.O_RDONLY | os.O_SYNC)
+        except OSError:
+            return None
+        try:
+            mem = mmap.mmap(fd, mmap.PAGESIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+        
+        level = (struct.unpack_from('<I', mem, GPLEV0_OFFSET)[0] >> POWER_BUTTON_PIN) & 1
+        if level != GPIO.input(POWER_BUTTON_PIN):
+            mem.close()
+            return None
+        return mem
+    
+    def _read_level(self):
+        """讀取按鈕腳位電平，優先使用映射的暫存器"""
+        mem = self._gpiomem
+        if mem is None:
+            return GPIO.input(POWER_BUTTON_PIN)
+        return (struct.unpack_from('<I', mem, GPLEV0_OFFSET)[0] >> POWER_BUTTON_PIN) & 1
+    
     def start_monitoring(self):
-        """開始監控按鈕"""
+        """開始監控按鈕：由核心偵測電平變化並回呼，不需背景輪詢"""
         if self.running:
             return
         
+        try:
+            GPIO.add_event_detect(POWER_BUTTON_PIN, GPIO.BOTH, callback=self._on_edge,
+                                  bouncetime=BOUNCE_TIME_MS)
+        except RuntimeError as e:
+            logging.error("無法啟用按鈕邊緣偵測: %s", e)
+            return
+        
         self.running = True
-        self.monitor_thread = threading.Thread(target=self._monitor_button, daemon=True)
-        self.monitor_thread.start()
-        print("🎮 遊戲控制按鈕監控已啟動")
+        logging.info("🎮 遊戲控制按鈕監控已啟動 (GPIO %s)", POWER_BUTTON_PIN)
+        logging.info("📍 正常狀態：未按下=HIGH，按下=LOW")
     
     def stop_monitoring(self):
         """停止監控按鈕"""
+        if not self.running:
+            return
         self.running = False
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=1.0)
-        print("⏹️ 遊戲控制按鈕監控已停止")
+        # 長按處理可能正在執行（放開按鈕時計時器參考已被清除），等它結束後才釋放 GPIO，關閉流程才有確定的終點
+        pending = {self._hold_timer, self._hold_thread} - {None, threading.current_thread()}
+        self._cancel_hold_timer()
+        for thread in pending:
+            thread.join(timeout=1.0)
+        try:
+            GPIO.remove_event_detect(POWER_BUTTON_PIN)
+        except RuntimeError:
+            pass
+        logging.info("⏹️ 遊戲控制按鈕監控已停止")
     
-    def _monitor_button(self):
-        """監控按鈕狀態（在背景執行緒中執行）"""
-        print(f"🔍 開始監控遊戲控制按鈕... (GPIO {POWER_BUTTON_PIN})")
-        print("📍 正常狀態：未按下=HIGH，按下=LOW")
+    def _on_edge(self, channel):
+        """按鈕電平變化回呼（在 GPIO 事件線程中執行）"""
+        if not self.running:
+            return
         
-        while self.running:
-            try:
-                time.sleep(DEBOUNCE_TIME)
-                button_state = GPIO.input(POWER_BUTTON_PIN)
-                current_time = time.time()
-                
-                # 檢測按鈕按下（HIGH → LOW）
-                if button_state == GPIO.LOW and self.last_button_state == GPIO.HIGH:
-                    self._handle_button_press(current_time)
-                
-                # 檢測按鈕釋放（LOW → HIGH）
-                elif button_state == GPIO.HIGH and self.last_button_state == GPIO.LOW:
-                    self._handle_button_release(current_time)
-                
-                # 更新按鈕持續時間（按下時為 LOW）
-                if button_state == GPIO.LOW and self.was_pressed:
-                    self.button_pressed_duration = current_time - self.last_press_time
-                    
-                    # 檢查長按
-                    if self.button_pressed_duration >= HOLD_DURATION:
-                        self._handle_long_press()
-                        # 等待按鈕釋放以避免重複觸發
-                        while GPIO.input(POWER_BUTTON_PIN) == GPIO.LOW and self.running:
-                            time.sleep(0.1)
-                
-                self.last_button_state = button_state
-                
-            except Exception as e:
-                print(f"按鈕監控錯誤: {e}")
-                time.sleep(0.1)
+        current_time = time.monotonic()
+        if self._read_level() == GPIO.LOW:
+            if self.was_pressed:
+                return
+            self._handle_button_press(current_time)
+            self._hold_timer = _HoldTimer(HOLD_DURATION, self._on_hold)
+            self._hold_timer.daemon = True
+            self._hold_timer.start()
+        else:
+            self._cancel_hold_timer()
+            self._handle_button_release(current_time)
+    
+    def _on_hold(self):
+        """長按計時到期：按鈕仍按住時觸發長按"""
+        thread = threading.current_thread()
+        self._hold_thread = thread
+        try:
+            if self.running and self.was_pressed and self._read_level() == GPIO.LOW:
+                self._handle_long_press()
+        finally:
+            # 處理結束後才清除參考，stop_monitoring 才能等到這裡
+            self._hold_thread = None
+            if self._hold_timer is thread:
+                self._hold_timer = None
+    
+    def _cancel_hold_timer(self):
+        """取消尚未到期的長按計時"""
+        timer = self._hold_timer
+        if timer is not None:
+            timer.cancel()
+            self._hold_timer = None
     
     def _handle_button_press(self, current_time):
         """處理按鈕按下事件"""
         self.was_pressed = True
         self.last_press_time = current_time
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] 🔴 遊戲控制按鈕按下 (LOW)")
+        logging.info("🔴 遊戲控制按鈕按下 (LOW)")
     
     def _handle_button_release(self, current_time):
         """處理按鈕釋放事件"""
@@ -124,168 +216,93 @@ class GameControlButton:
             return
         
         press_duration = current_time - self.last_press_time
-        timestamp = datetime.now().strftime('%H:%M:%S')
         
-        # 判斷是短按還是長按（如果還沒有觸發長按事件）
-        if press_duration >= SHORT_PRESS_MIN and press_duration < HOLD_DURATION:
+        # 已觸發長按時放開不再算短按
+        if self._long_press_fired:
+            self._long_press_fired = False
+            logging.info("🟢 按鈕釋放 (HIGH) (%.2fs)", press_duration)
+        elif press_duration >= SHORT_PRESS_MIN:
             self._handle_short_press()
-            print(f"[{timestamp}] 🟢 按鈕釋放 (HIGH) - 短按 ({press_duration:.2f}s)")
+            logging.info("🟢 按鈕釋放 (HIGH) - 短按 (%.2fs)", press_duration)
         else:
-            print(f"[{timestamp}] 🟢 按鈕釋放 (HIGH) ({press_duration:.2f}s)")
+            logging.info("🟢 按鈕釋放 (HIGH) (%.2fs)", press_duration)
         
         # 重設狀態
         self.was_pressed = False
-        self.button_pressed_duration = 0
         self.last_press_time = 0
     
     def _handle_short_press(self):
         """處理短按事件 - 暫停/繼續遊戲"""
         self.short_press_count += 1
-        print(f"📝 短按檢測 (第 {self.short_press_count} 次) - 暫停/繼續遊戲")
+        logging.info("📝 短按檢測 (第 %s 次) - 暫停/繼續遊戲", self.short_press_count)
         
         # 將事件加入佇列
-        self.event_queue.put({
-            'type': 'short_press',
-            'action': 'toggle_pause',
-            'timestamp': time.time()
-        })
-        
-        # 如果有主控制台實例，直接調用相關方法
-        if self.main_console:
-            try:
-                self._toggle_game_pause()
-            except Exception as e:
-                print(f"切換遊戲暫停狀態時發生錯誤: {e}")
+        self.event_queue.append(ButtonEvent(*_SHORT_PRESS, time.monotonic()))
     
     def _handle_long_press(self):
         """處理長按事件 - 返回主選單"""
         self.long_press_count += 1
-        print(f"📝 長按檢測 (第 {self.long_press_count} 次) - 返回主選單")
+        self._long_press_fired = True
+        logging.info("📝 長按檢測 (第 %s 次) - 返回主選單", self.long_press_count)
         
         # 將事件加入佇列
-        self.event_queue.put({
-            'type': 'long_press',
-            'action': 'return_to_menu',
-            'timestamp': time.time()
-        })
-        
-        # 如果有主控制台實例，直接調用相關方法
-        if self.main_console:
-            try:
-                self._return_to_main_menu()
-            except Exception as e:
-                print(f"返回主選單時發生錯誤: {e}")
-    
-    def _toggle_game_pause(self):
-        """切換遊戲暫停狀態"""
-        if not self.main_console:
-            return
-        
-        if self.main_console.state == "GAME" and self.main_console.current_game:
-            # 如果遊戲有暫停功能
-            if hasattr(self.main_console.current_game, 'paused'):
-                current_pause_state = getattr(self.main_console.current_game, 'paused', False)
-                self.main_console.current_game.paused = not current_pause_state
-                
-                if self.main_console.current_game.paused:
-                    print("⏸️ 遊戲已暫停")
-                    # 設定交通燈為黃色表示暫停
-                    if self.main_console.traffic_light:
-                        self.main_console.traffic_light.yellow_on()
-                else:
-                    print("▶️ 遊戲已繼續")
-                    # 設定交通燈為綠色表示運行
-                    if self.main_console.traffic_light:
-                        self.main_console.traffic_light.green_on()
-            else:
-                print("⚠️ 當前遊戲不支援暫停功能")
-        else:
-            print("⚠️ 沒有正在運行的遊戲")
-    
-    def _return_to_main_menu(self):
-        """返回主選單"""
-        if not self.main_console:
-            return
-        
-        if self.main_console.state == "GAME":
-            print("🏠 正在返回主選單...")
-            
-            # 結束當前遊戲
-            if self.main_console.current_game:
-                try:
-                    if hasattr(self.main_console.current_game, 'cleanup'):
-                        self.main_console.current_game.cleanup()
-                except Exception as e:
-                    print(f"清理遊戲時發生錯誤: {e}")
-            
-            # 重設狀態
-            self.main_console.current_game = None
-            self.main_console.state = "MENU"
-            self.main_console.current_selection = 0
-            
-            # 更新SPI螢幕顯示
-            if self.main_console.spi_screen:
-                try:
-                    self.main_console.spi_screen.display_menu(
-                        self.main_console.games,
-                        self.main_console.current_selection
-                    )
-                except Exception as e:
-                    print(f"更新SPI螢幕時發生錯誤: {e}")
-            
-            # 設定交通燈為紅色表示在選單
-            if self.main_console.traffic_light:
-                self.main_console.traffic_light.red_on()
-            
-            # 播放返回音效
-            if self.main_console.buzzer:
-                try:
-                    self.main_console.buzzer.play_tone(440, 0.1)  # A4 音符
-                    time.sleep(0.05)
-                    self.main_console.buzzer.play_tone(330, 0.1)  # E4 音符
-                except Exception as e:
-                    print(f"播放音效時發生錯誤: {e}")
-            
-            print("✅ 已返回主選單")
-        else:
-            print("⚠️ 已經在主選單中")
+        self.event_queue.append(ButtonEvent(*_LONG_PRESS, time.monotonic()))
     
     def get_pending_events(self):
-        """獲取待處理的事件"""
+        """
+        獲取待處理的事件
+        
+        事件中的 timestamp 為 time.monotonic() 值，只適合計算間隔，並非牆上時間
+        """
+        # 主循環每幀都會呼叫，大多數時候沒有事件，直接返回共用的空序列
+        if not self.event_queue:
+            return ()
         events = []
-        while not self.event_queue.empty():
-            try:
-                events.append(self.event_queue.get_nowait())
-            except queue.Empty:
-                break
+        while self.event_queue:
+            events.append(self.event_queue.popleft())
         return events
     
     def get_status(self):
         """獲取按鈕狀態資訊"""
-        current_state = GPIO.input(POWER_BUTTON_PIN) if self.running else None
+        current_state = self._read_level() if self.running else None
         return {
             'running': self.running,
             'short_press_count': self.short_press_count,
             'long_press_count': self.long_press_count,
-            'current_gpio_state': 'HIGH' if current_state == GPIO.HIGH else 'LOW' if current_state == GPIO.LOW else 'UNKNOWN',
-            'is_pressed': current_state == GPIO.LOW if self.running else False,  # LOW 表示按下
+            'current_gpio_state': self._STATE_NAMES.get(current_state, 'UNKNOWN'),
+            'is_pressed': current_state == GPIO.LOW,  # LOW 表示按下
             'gpio_pin': POWER_BUTTON_PIN
         }
     
+    def __enter__(self):
+        self.start_monitoring()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+        return False
+    
     def cleanup(self):
         """清理資源"""
-        print("🧹 正在清理遊戲控制按鈕資源...")
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+        logging.info("🧹 正在清理遊戲控制按鈕資源...")
         
         self.stop_monitoring()
         
+        if self._gpiomem is not None:
+            self._gpiomem.close()
+            self._gpiomem = None
+        
         try:
             GPIO.cleanup([POWER_BUTTON_PIN])
-            print("✓ GPIO 清理完成")
+            logging.info("✓ GPIO 清理完成")
         except Exception as e:
-            print(f"⚠️ GPIO 清理時發生警告: {e}")
+            logging.warning("⚠️ GPIO 清理時發生警告: %s", e)
         
-        print(f"📊 按鈕使用統計: 短按 {self.short_press_count} 次, 長按 {self.long_press_count} 次")
-        print("✅ 遊戲控制按鈕清理完成")
+        logging.info("📊 按鈕使用統計: 短按 %s 次, 長按 %s 次", self.short_press_count, self.long_press_count)
+        logging.info("✅ 遊戲控制按鈕清理完成")
 
 
 def test_button_wiring():
@@ -354,50 +371,55 @@ def test_button_wiring():
             pass
 
 
+# 測試迴圈的狀態列格式（以 \r 覆寫同一行）
+_STATUS_LINE = "\r📊 GPIO 狀態: %s | 按下: %s | 短按: %d | 長按: %d     "
+
+
 def run_corrected_test():
     """執行修正版按鈕測試"""
     print("🎮 修正版按鈕測試程式")
     print("=" * 50)
     
     try:
-        button = GameControlButton()
-        button.start_monitoring()
-        
-        print("✅ 按鈕監控已啟動")
-        print("📋 請測試按鈕功能：")
-        print("  • 短按：應該檢測到暫停/繼續功能")
-        print("  • 長按 3 秒：應該檢測到返回選單功能")
-        print("  • 按 Ctrl+C 停止測試")
-        print()
-        
-        while True:
-            time.sleep(1)
-            
-            # 檢查待處理事件
-            events = button.get_pending_events()
-            for event in events:
-                print(f"🔔 事件觸發: {event['action']} ({event['type']})")
+        with GameControlButton() as button:
+            print("✅ 按鈕監控已啟動")
+            print("📋 請測試按鈕功能：")
+            print("  • 短按：應該檢測到暫停/繼續功能")
+            print("  • 長按 3 秒：應該檢測到返回選單功能")
+            print("  • 按 Ctrl+C 停止測試")
+            print()
             
-            # 顯示當前狀態
-            status = button.get_status()
-            if status['current_gpio_state']:
-                print(f"\r📊 GPIO 狀態: {status['current_gpio_state']} | "
-                      f"按下: {'是' if status['is_pressed'] else '否'} | "
-                      f"短按: {status['short_press_count']} | "
-                      f"長按: {status['long_press_count']}     ", end='', flush=True)
-    
+            while True:
+                time.sleep(1)
+                
+                # 檢查待處理事件
+                events = button.get_pending_events()
+                for event in events:
+                    print(f"🔔 事件觸發: {event.action} ({event.type})")
+                
+                # 顯示當前狀態
+                status = button.get_status()
+                if status['current_gpio_state']:
+                    sys.stdout.write(_STATUS_LINE % (
+                        status['current_gpio_state'],
+                        '是' if status['is_pressed'] else '否',
+                        status['short_press_count'],
+                        status['long_press_count']
+                    ))
+                    sys.stdout.flush()
+        
     except KeyboardInterrupt:
         print("\n\n⏹️ 測試停止")
     except Exception as e:
         print(f"\n❌ 測試過程中發生錯誤: {e}")
     finally:
-        if 'button' in locals():
-            button.cleanup()
         print("\n🧹 測試程式結束")
 
 
 def main():
     """主程式選單"""
+    # 獨立執行時讓類別中的日誌直接輸出到終端，時間由日誌格式加上
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s', datefmt='%H:%M:%S')
     print("🔧 按鈕問題診斷與修正工具")
     print("=" * 50)
     
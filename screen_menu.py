@@ -4,11 +4,29 @@
 
 import time
 import os
+import re
+import queue
+import threading
+from collections import namedtuple
+from functools import lru_cache
 import RPi.GPIO as GPIO
 from luma.core.interface.serial import spi
-from luma.core.render import canvas
 from luma.lcd.device import ili9341  # 2.8寸TFT通常使用ILI9341控制器
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageColor, ImageDraw, ImageFont
+
+# NumPy 用於將 RGB888 畫面轉為 RGB565，未安裝時以 18 位元色彩傳送
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Numba 將 RGB565 轉換編譯成原生迴圈（Pi Zero 上 NumPy 的逐步運算較慢），未安裝時使用 NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # 2.8寸TFT SPI螢幕設定 (240x320)
 SPI_PORT = 0      # SPI0
@@ -17,19 +35,116 @@ SPI_DC = 25       # Data/Command腳位
 SPI_RST = 24      # Reset腳位
 SPI_CS = 8        # Chip Select腳位
 SPI_LED = 27      # 背光控制腳位
+IDLE_BRIGHTNESS = 20  # 閒置時的背光亮度 (%)
+SPI_BUS_SPEED_HZ = 40000000  # SPI時脈 40MHz（luma 預設 8MHz，ILI9341 可穩定運作於 40MHz）
 
 # 螢幕規格
 DISPLAY_WIDTH = 240   # TFT螢幕寬度
 DISPLAY_HEIGHT = 320  # TFT螢幕高度
 DEFAULT_FONT_SIZE = 18  # 適合240x320解析度的字體大小
 
+# ILI9341 指令：設定寫入的欄/列範圍並開始寫入顯示記憶體
+ILI9341_CASET = 0x2A
+ILI9341_PASET = 0x2B
+ILI9341_RAMWR = 0x2C
+ILI9341_COLMOD = 0x3A
+ILI9341_PIXEL_16BIT = 0x55  # RGB565，每像素 2 位元組（luma 預設為 18 位元、每像素 3 位元組）
+COMPOSE_MODE = 'RGB'  # 所有畫面的繪製模式，送出前不做任何模式轉換
+SPI_BULK_TRANSFER_SIZE = DISPLAY_WIDTH * DISPLAY_HEIGHT * 3  # 啟用 writebytes2 時一次交出整個畫面
+FLUSH_QUEUE_SIZE = 2  # 等待傳送的畫面上限，繪製超前太多時由呼叫端等待
+DIRTY_BAND_GAP = 16  # 變更列之間相隔超過此列數時分成兩個區域傳送
+
+# 換行單位：中日韓文字與全形標點逐字可斷行，其餘以連續的非空白字元為一個單字，空白另成一段
+_CJK_CHARS = '\u2e80-\u9fff\uf900-\ufaff\ufe30-\ufe4f\uff00-\uffef'
+_WRAP_TOKEN_RE = re.compile(rf'[{_CJK_CHARS}]|[^\s{_CJK_CHARS}]+|\s+')
+
+# 遊戲結束畫面的評價 (最低分數, 文字, 顏色)，依序比對，都不符合時使用最後一項
+GAME_OVER_COMMENTS = (
+    (1000, "🌟 驚人表現！", "green"),
+    (500, "⭐ 表現不錯！", "yellow"),
+    (100, "👍 繼續加油！", "cyan"),
+    (None, "💪 再接再厲！", "white"),
+)
+NEW_RECORD_TEXT = "🏆 新紀錄！"
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _pack_rgb565(rgb, out):
+        """將 RGB888 陣列逐像素打包成大端序 RGB565，寫入預先配置的 out (高, 寬*2)"""
+        height, width, _ = rgb.shape
+        for y in range(height):
+            for x in range(width):
+                r = rgb[y, x, 0]
+                g = rgb[y, x, 1]
+                b = rgb[y, x, 2]
+                out[y, x * 2] = (r & 0xF8) | (g >> 5)
+                out[y, x * 2 + 1] = ((g << 3) & 0xE0) | (b >> 3)
+
+
+@lru_cache(maxsize=1024)
+def _text_bbox(font, text):
+    """
+    量測文字邊界（依字體與文字快取，固定的介面字串不再重複走 FreeType）
+    
+    所有寬度、換行與遮罩都經由此函式量測，TrueType 與預設點陣字體結果一致
+    """
+    try:
+        return font.getbbox(text)
+    except AttributeError:
+        # 舊版 Pillow 的點陣字體沒有 getbbox
+        width, height = font.getsize(text)
+        return 0, 0, width, height
+
+
+def _text_width(font, text):
+    """量測文字寬度"""
+    left, _, right, _ = _text_bbox(font, text)
+    return right - left
+
+
+@lru_cache(maxsize=256)
+def _text_mask(font, text):
+    """
+    將文字點陣化成灰階遮罩（依字體與文字快取），之後只需貼上不必再經過 FreeType
+    
+    返回:
+        (遮罩影像, 遮罩相對於文字原點的偏移)
+    """
+    left, top, right, bottom = _text_bbox(font, text)
+    mask = Image.new('L', (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+    return mask, (left, top)
+
+
+@lru_cache(maxsize=32)
+def _scrollbar_offsets(game_count, visible_count, scrollbar_height):
+    """各起始索引對應的滾動條滑塊位移（依項目數、可見數與高度快取）"""
+    span = game_count - visible_count
+    return tuple(int((start_idx / span) * scrollbar_height) for start_idx in range(span + 1))
+
+
+@lru_cache(maxsize=1024)
+def _word_metrics(font, word):
+    """單字的 (左緣, 右緣, 前進寬度)，供換行時累加整行寬度"""
+    left, _, right, _ = _text_bbox(font, word)
+    try:
+        return left, right, font.getlength(word)
+    except AttributeError:
+        return left, right, right
+
 class SPIScreenManager:
     """2.8寸TFT SPI螢幕管理類 (240x320)"""
     
-    def __init__(self, display_width=DISPLAY_WIDTH, display_height=DISPLAY_HEIGHT):
+    def __init__(self, display_width=DISPLAY_WIDTH, display_height=DISPLAY_HEIGHT,
+                 show_splash=True, splash_duration=0):
         self.width = display_width
         self.height = display_height
         
+        # 初始化畫面設定：預設不停留，下一個畫面會直接覆蓋初始化畫面
+        self._show_splash = show_splash
+        self._splash_duration = splash_duration
+        
         # GPIO腳位設定
         self.SPI_DC = SPI_DC
         self.SPI_RST = SPI_RST
@@ -46,12 +161,97 @@ class SPIScreenManager:
         self.CYAN = "cyan"
         self.MAGENTA = "magenta"
         
+        # 換行結果快取 {(text, max_width, font): lines}，說明文字固定不變
+        self._wrap_cache = {}
+        
+        # 螢幕上目前的畫面與其內容識別鍵，只傳送與上一畫面不同的區域
+        self._shown_image = None
+        self._shown_key = None
+        # 選單底圖快取 {(遊戲id元組, 起始索引): Image}，只含未選中的項目
+        self._menu_base_cache = {}
+        # 兩個常駐畫面緩衝區輪流使用：一個是螢幕上的畫面（供比對），另一個用來繪製下一畫面
+        self._frames = [Image.new(COMPOSE_MODE, (self.width, self.height), self.BLACK) for _ in range(2)]
+        self._frame_draws = [ImageDraw.Draw(frame) for frame in self._frames]
+        self._back = 0
+        # 背景傳送執行緒與其佇列，初始化完成後才啟動（初始化畫面直接傳送）
+        self._flush_queue = None
+        self._flush_thread = None
+        
+        # 背光 PWM 物件，第一次調整亮度時建立，之後只改變工作週期
+        self._pwm = None
+        self._idle = False
+        
+        # 清除畫面用的整幀像素資料 {顏色: memoryview}，清除時直接切片送出
+        self._fill_cache = {}
+        
+        # Numba 打包用的輸出緩衝區，依整個畫面大小配置一次，各區域共用
+        self._pack_out = None
+        if NUMBA_AVAILABLE:
+            self._pack_out = np.empty(self.width * self.height * 2, dtype=np.uint8)
+            # 先以小影像觸發編譯，第一個畫面不必等待 JIT；
+            # 輸入需同樣來自 np.asarray(image)（唯讀陣列），否則實際畫面會再編譯一次另一種型別
+            _pack_rgb565(np.asarray(Image.new(COMPOSE_MODE, (4, 4))), np.empty((4, 8), dtype=np.uint8))
+        
         # 初始化螢幕和字體
         self.device = self._initialize_device()
+        
+        # 顯示初始化畫面
+        if self.device and self._show_splash:
+            self._show_init_screen()
+        
         self.font_small = None
         self.font_medium = None
         self.font_large = None
         self._load_fonts()
+        
+        # 各畫面固定不變的底圖，顯示時複製後只畫動態內容
+        self._tmpl_instructions = None
+        self._tmpl_gameover = None
+        self._tmpl_message = None
+        self._tmpl_loading = None
+        self._tmpl_progress = None
+        # 載入動畫底圖 (訊息, Image)，動畫更新時只重畫載入點
+        self._loading_bg = None
+        if self.device and self.font_medium:
+            self._build_templates()
+        
+        # 背景傳送執行緒：主執行緒繪製下一畫面時，上一畫面同時經由 SPI 送出
+        if self.device:
+            self._start_flush_thread()
+    
+    def _start_flush_thread(self):
+        """啟動背景畫面傳送執行緒"""
+        self._flush_queue = queue.Queue(maxsize=FLUSH_QUEUE_SIZE)
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="SPIFlush", daemon=True)
+        self._flush_thread.start()
+    
+    def _flush_loop(self):
+        """依序取出待傳送的區域並寫入螢幕，收到 None 時結束"""
+        while True:
+            regions = self._flush_queue.get()
+            try:
+                if regions is None:
+                    return
+                for box, region in regions:
+                    self._write_region(box, region)
+            except Exception as e:
+                print(f"傳送畫面失敗: {e}")
+            finally:
+                self._flush_queue.task_done()
+    
+    def _stop_flush_thread(self):
+        """送完剩餘畫面後結束傳送執行緒，之後的畫面直接在呼叫端傳送"""
+        if self._flush_thread is None:
+            return
+        if self._flush_thread.is_alive():
+            self._flush_queue.put(None)
+            self._flush_thread.join(timeout=2)
+        self._flush_thread = None
+    
+    def flush(self):
+        """等待已排入的畫面全部送到螢幕"""
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            self._flush_queue.join()
     
     def _initialize_device(self):
         """初始化2.8寸TFT SPI螢幕"""
@@ -65,9 +265,13 @@ class SPIScreenManager:
                 port=SPI_PORT, 
                 device=SPI_DEVICE, 
                 gpio_DC=self.SPI_DC, 
-                gpio_RST=self.SPI_RST
+                gpio_RST=self.SPI_RST,
+                bus_speed_hz=SPI_BUS_SPEED_HZ
             )
             
+            # 整塊資料交給 spidev 在 C 層分段傳送
+            self._enable_bulk_writes(serial)
+            
             # 初始化ILI9341控制器的TFT螢幕
             device = ili9341(
                 serial, 
@@ -78,9 +282,11 @@ class SPIScreenManager:
             
             print(f"✓ 2.8寸TFT SPI螢幕初始化成功 ({self.width}x{self.height})")
             print(f"  使用ILI9341控制器，背光腳位: GPIO {self.SPI_LED}")
+            print(f"  SPI時脈: {serial._spi.max_speed_hz / 1000000:g} MHz")
             
-            # 顯示初始化畫面
-            self._show_init_screen(device)
+            # 所有畫面都由 _write_region 自行傳送，可改用 16 位元色彩減少傳輸量
+            if NUMPY_AVAILABLE:
+                device.command(ILI9341_COLMOD, ILI9341_PIXEL_16BIT)
             
             return device
             
@@ -102,50 +308,64 @@ class SPIScreenManager:
                 pass
             return None
     
-    def _show_init_screen(self, device):
+    @staticmethod
+    def _enable_bulk_writes(serial):
+        """
+        讓 luma 的 SPI 介面以 spidev.writebytes2 傳送資料
+        
+        luma 預設以 4096 位元組為單位呼叫 writebytes，而 writebytes 會先把資料轉成
+        Python 整數序列；writebytes2 直接讀取 bytes 緩衝區，並由 C 層依 spidev 緩衝區
+        大小自動分段，因此不必再由 luma 切成小塊。
+        
+        返回:
+            是否已啟用
+        """
+        spidev = getattr(serial, '_spi', None)
+        writebytes2 = getattr(spidev, 'writebytes2', None)
+        if writebytes2 is None:
+            return False
+        serial._write_bytes = writebytes2
+        serial._transfer_size = SPI_BULK_TRANSFER_SIZE
+        return True
+    
+    def _show_init_screen(self):
         """顯示初始化畫面"""
         try:
-            with canvas(device) as draw:
-                # 黑色背景
-                draw.rectangle(device.bounding_box, outline=self.BLACK, fill=self.BLACK)
-                
-                # 顯示初始化訊息
-                init_text = "TFT 螢幕初始化"
-                spec_text = f"{self.width}x{self.height}"
-                
-                # 使用預設字體
-                font = ImageFont.load_default()
-                
-                # 計算文字位置
-                try:
-                    text_bbox = draw.textbbox((0, 0), init_text, font=font)
-                    text_w = text_bbox[2] - text_bbox[0]
-                    text_h = text_bbox[3] - text_bbox[1]
-                except AttributeError:
-                    text_w, text_h = draw.textsize(init_text, font=font)
-                
-                # 繪製文字
-                draw.text(
-                    ((self.width - text_w) // 2, self.height // 2 - text_h), 
-                    init_text, 
-                    fill=self.WHITE, 
-                    font=font
-                )
-                
-                try:
-                    spec_bbox = draw.textbbox((0, 0), spec_text, font=font)
-                    spec_w = spec_bbox[2] - spec_bbox[0]
-                except AttributeError:
-                    spec_w, _ = draw.textsize(spec_text, font=font)
-                
-                draw.text(
-                    ((self.width - spec_w) // 2, self.height // 2 + 5), 
-                    spec_text, 
-                    fill=self.GREEN, 
-                    font=font
-                )
+            image, draw = self._begin()
+            
+            # 顯示初始化訊息
+            init_text = "TFT 螢幕初始化"
+            spec_text = f"{self.width}x{self.height}"
+            
+            # 使用預設字體
+            font = ImageFont.load_default()
+            
+            # 計算文字位置
+            text_left, text_top, text_right, text_bottom = _text_bbox(font, init_text)
+            text_w = text_right - text_left
+            text_h = text_bottom - text_top
+            
+            # 繪製文字
+            draw.text(
+                ((self.width - text_w) // 2, self.height // 2 - text_h), 
+                init_text, 
+                fill=self.WHITE, 
+                font=font
+            )
+            
+            spec_w = _text_width(font, spec_text)
+            
+            draw.text(
+                ((self.width - spec_w) // 2, self.height // 2 + 5), 
+                spec_text, 
+                fill=self.GREEN, 
+                font=font
+            )
             
-            time.sleep(1)  # 顯示1秒
+            self._present(image)
+            
+            if self._splash_duration > 0:
+                time.sleep(self._splash_duration)
             
         except Exception as e:
             print(f"初始化畫面顯示失敗: {e}")
@@ -199,8 +419,8 @@ class SPIScreenManager:
             color = self.BLACK
             
         try:
-            with canvas(self.device) as draw:
-                draw.rectangle(self.device.bounding_box, outline=color, fill=color)
+            image, _ = self._begin(color=color)
+            self._present(image, fill=color)
         except Exception as e:
             print(f"清除螢幕失敗: {e}")
     
@@ -211,89 +431,201 @@ class SPIScreenManager:
             return
         
         try:
-            with canvas(self.device) as draw:
-                # 黑色背景
-                draw.rectangle(self.device.bounding_box, outline=self.BLACK, fill=self.BLACK)
-                
-                # 標題
-                title_text = "🎮 遊戲選單"
-                self._draw_centered_text(draw, title_text, 10, self.font_large, self.CYAN)
-                
-                # 分隔線
-                draw.line([(10, 45), (self.width - 10, 45)], fill=self.WHITE, width=2)
-                
-                # 計算可顯示的遊戲項目數量
-                item_height = 30  # 每個項目的高度
-                available_height = self.height - 60 - 40  # 扣除標題和底部空間
-                visible_count = available_height // item_height
-                
-                # 計算滾動偏移
-                start_idx = 0
-                if len(games) > visible_count:
-                    start_idx = max(0, selected_index - (visible_count // 2))
-                    start_idx = min(start_idx, len(games) - visible_count)
-                
-                # 繪製遊戲項目
-                for i in range(visible_count):
-                    actual_idx = start_idx + i
-                    if actual_idx >= len(games):
-                        break
-                    
-                    y_pos = 55 + i * item_height
-                    
-                    # 選中項目的背景
-                    if actual_idx == selected_index:
-                        draw.rectangle(
-                            [(5, y_pos - 2), (self.width - 5, y_pos + item_height - 8)],
-                            outline=self.BLUE,
-                            fill=self.BLUE
-                        )
-                        text_color = self.WHITE
-                        prefix = "▶ "
-                    else:
-                        text_color = self.WHITE
-                        prefix = "  "
-                    
-                    # 遊戲文字
-                    game_text = f"{prefix}{games[actual_idx]['id']}. {games[actual_idx]['name']}"
-                    
-                    # 確保文字不會超出螢幕
-                    max_chars = 28  # 240寬度大約可容納28個字符
-                    if len(game_text) > max_chars:
-                        game_text = game_text[:max_chars-3] + "..."
-                    
-                    draw.text((10, y_pos), game_text, fill=text_color, font=self.font_medium)
+            game_ids = tuple(game.id for game in games)
+            key = ('menu', game_ids, selected_index)
+            if key == self._shown_key:
+                return
+            
+            item_height, available_height, visible_count = self._menu_geometry()
+            start_idx = self._menu_start_index(len(games), selected_index, visible_count)
+            base = self._get_menu_base(games, game_ids, start_idx)
+            
+            image, draw = self._begin(base)
+            
+            # 只需在底圖上補畫選中項目
+            row = selected_index - start_idx
+            if 0 <= row < visible_count and selected_index < len(games):
+                y_pos = 55 + row * item_height
+                draw.rectangle(
+                    [(5, y_pos - 2), (self.width - 5, y_pos + item_height - 8)],
+                    outline=self.BLUE,
+                    fill=self.BLUE
+                )
+                game_text = self._menu_item_text(games[selected_index], "▶ ")
+                self._draw_text(draw, (10, y_pos), game_text, self.font_medium, self.WHITE)
                 
-                # 滾動指示器
+                # 滾動條畫在選中項目之上
                 if len(games) > visible_count:
-                    # 繪製滾動條
-                    scrollbar_height = available_height
-                    scrollbar_pos = (start_idx / (len(games) - visible_count)) * scrollbar_height
-                    
-                    draw.rectangle(
-                        [(self.width - 8, 55), (self.width - 5, 55 + scrollbar_height)],
-                        outline=self.WHITE,
-                        fill=self.BLACK
-                    )
-                    
-                    draw.rectangle(
-                        [(self.width - 8, 55 + int(scrollbar_pos)), 
-                         (self.width - 5, 55 + int(scrollbar_pos) + 20)],
-                        fill=self.YELLOW
-                    )
-                
-                # 底部提示
-                hint_text = "🎯 A:選擇 B:退出"
-                self._draw_centered_text(
-                    draw, hint_text, 
-                    self.height - 25, 
-                    self.font_small, 
-                    self.GREEN
-                )
+                    self._draw_scrollbar(draw, start_idx, len(games), visible_count, available_height)
+            
+            self._present(image, key)
                 
         except Exception as e:
             print(f"顯示選單失敗: {e}")
     
+    def _menu_geometry(self):
+        """選單版面：(項目高度, 可用高度, 可顯示的項目數量)"""
+        item_height = 30  # 每個項目的高度
+        available_height = self.height - 60 - 40  # 扣除標題和底部空間
+        return item_height, available_height, available_height // item_height
+    
+    @staticmethod
+    def _menu_start_index(game_count, selected_index, visible_count):
+        """計算滾動偏移，讓選中項目盡量位於可見範圍中央"""
+        start_idx = 0
+        if game_count > visible_count:
+            start_idx = max(0, selected_index - (visible_count // 2))
+            start_idx = min(start_idx, game_count - visible_count)
+        return start_idx
+    
+    def _get_menu_base(self, games, game_ids, start_idx):
+        """取得 (遊戲id元組, 起始索引) 對應的選單底圖，尚未建立時繪製並快取"""
+        base = self._menu_base_cache.get((game_ids, start_idx))
+        if base is None:
+            item_height, available_height, visible_count = self._menu_geometry()
+            base = self._build_menu_base(games, start_idx, visible_count, item_height, available_height)
+            self._menu_base_cache[(game_ids, start_idx)] = base
+        return base
+    
+    def _menu_item_text(self, game, prefix):
+        """組合選單項目文字，過長時截斷"""
+        game_text = f"{prefix}{game.id}. {game.name}"
+        
+        # 確保文字不會超出螢幕
+        max_chars = 28  # 240寬度大約可容納28個字符
+        if len(game_text) > max_chars:
+            game_text = game_text[:max_chars-3] + "..."
+        return game_text
+    
+    def _build_menu_base(self, games, start_idx, visible_count, item_height, available_height):
+        """繪製選單底圖：標題、未選中的項目、滾動條與提示"""
+        image = Image.new(COMPOSE_MODE, (self.width, self.height), self.BLACK)
+        draw = ImageDraw.Draw(image)
+        
+        # 標題
+        title_text = "🎮 遊戲選單"
+        self._draw_centered_text(draw, title_text, 10, self.font_large, self.CYAN)
+        
+        # 分隔線
+        draw.line([(10, 45), (self.width - 10, 45)], fill=self.WHITE, width=2)
+        
+        # 繪製遊戲項目
+        for i in range(visible_count):
+            actual_idx = start_idx + i
+            if actual_idx >= len(games):
+                break
+            
+            y_pos = 55 + i * item_height
+            game_text = self._menu_item_text(games[actual_idx], "  ")
+            self._draw_text(draw, (10, y_pos), game_text, self.font_medium, self.WHITE)
+        
+        # 滾動指示器
+        if len(games) > visible_count:
+            self._draw_scrollbar(draw, start_idx, len(games), visible_count, available_height)
+        
+        # 底部提示
+        hint_text = "🎯 A:選擇 B:退出"
+        self._draw_centered_text(
+            draw, hint_text, 
+            self.height - 25, 
+            self.font_small, 
+            self.GREEN
+        )
+        return image
+    
+    def _draw_scrollbar(self, draw, start_idx, game_count, visible_count, scrollbar_height):
+        """繪製滾動條"""
+        scrollbar_pos = _scrollbar_offsets(game_count, visible_count, scrollbar_height)[start_idx]
+        
+        draw.rectangle(
+            [(self.width - 8, 55), (self.width - 5, 55 + scrollbar_height)],
+            outline=self.WHITE,
+            fill=self.BLACK
+        )
+        
+        draw.rectangle(
+            [(self.width - 8, 55 + scrollbar_pos), 
+             (self.width - 5, 55 + scrollbar_pos + 20)],
+            fill=self.YELLOW
+        )
+    
+    def _build_templates(self):
+        """預先繪製說明、遊戲結束、訊息與載入畫面的靜態圖層"""
+        # 遊戲說明：分隔線、標題、控制說明與底部提示
+        image = Image.new(COMPOSE_MODE, (self.width, self.height), self.BLACK)
+        draw = ImageDraw.Draw(image)
+        draw.line([(10, 45), (self.width - 10, 45)], fill=self.WHITE, width=2)
+        self._draw_text(draw, (10, 55), "📋 操作說明:", self.font_medium, self.CYAN)
+        
+        control_y = self.height - 70
+        self._draw_text(draw, (10, control_y), "🎮 控制說明:", self.font_medium, self.CYAN)
+        controls = [
+            "搖桿：移動/選擇",
+            "A鈕：確認/行動", 
+            "B鈕：取消/暫停"
+        ]
+        for i, control in enumerate(controls):
+            self._draw_text(draw, (10, control_y + 25 + i * 20), f"• {control}", 
+                            self.font_small, self.GREEN)
+        self._draw_centered_text(
+            draw, "A:開始遊戲 B:返回選單", 
+            self.height - 15, 
+            self.font_small, 
+            self.WHITE
+        )
+        self._tmpl_instructions = image
+        
+        # 遊戲結束：標題與底部提示
+        image = Image.new(COMPOSE_MODE, (self.width, self.height), self.BLACK)
+        draw = ImageDraw.Draw(image)
+        self._draw_centered_text(draw, "🎯 遊戲結束", 50, self.font_large, self.RED)
+        self._draw_centered_text(draw, "按任意鍵返回選單", self.height - 30, self.font_small, self.WHITE)
+        self._tmpl_gameover = image
+        
+        # 評價與新紀錄文字含表情符號，啟動時先點陣化，第一次遊戲結束不必等 FreeType
+        for _, comment, _ in GAME_OVER_COMMENTS:
+            _text_mask(self.font_medium, comment)
+        _text_mask(self.font_medium, NEW_RECORD_TEXT)
+        
+        # 自定義訊息：分隔線
+        image = Image.new(COMPOSE_MODE, (self.width, self.height), self.BLACK)
+        ImageDraw.Draw(image).line([(20, 90), (self.width - 20, 90)], fill=self.WHITE, width=2)
+        self._tmpl_message = image
+        
+        # 載入畫面：空白底圖，以及含進度條框架的底圖
+        self._tmpl_loading = Image.new(COMPOSE_MODE, (self.width, self.height), self.BLACK)
+        image = self._tmpl_loading.copy()
+        draw = ImageDraw.Draw(image)
+        draw.rectangle(
+            [(20, 150), (self.width - 20, 170)],
+            outline=self.WHITE,
+            fill=self.BLACK
+        )
+        self._tmpl_progress = image
+    
+    def preload_games(self, games):
+        """
+        預先換行並點陣化所有遊戲的名稱與說明，並建立各捲動位置的選單底圖，
+        第一次開啟選單或說明畫面也不必等待排版
+        
+        參數:
+            games: 遊戲列表（需有 name 與 description 屬性）
+        """
+        if not self.font_medium:
+            return
+        
+        for game in games:
+            _text_mask(self.font_large, game.name)
+            _text_mask(self.font_medium, self._menu_item_text(game, "▶ "))
+            for line in self._wrap_text(game.description or '暫無說明', self.width - 20, self.font_medium):
+                _text_mask(self.font_medium, line)
+        
+        # 每個選取位置會用到的選單底圖都先建立，選單第一次捲動時只需貼上
+        game_ids = tuple(game.id for game in games)
+        _, _, visible_count = self._menu_geometry()
+        for start_idx in {self._menu_start_index(len(games), i, visible_count) for i in range(len(games))}:
+            self._get_menu_base(games, game_ids, start_idx)
+    
     def display_game_instructions(self, game):
         """顯示遊戲說明，針對240x320解析度優化"""
         if not self.device or not self.font_medium:
@@ -301,53 +633,28 @@ class SPIScreenManager:
             return
         
         try:
-            with canvas(self.device) as draw:
-                # 黑色背景
-                draw.rectangle(self.device.bounding_box, outline=self.BLACK, fill=self.BLACK)
-                
-                # 遊戲名稱
-                game_name = game['name']
-                self._draw_centered_text(draw, game_name, 10, self.font_large, self.YELLOW)
-                
-                # 分隔線
-                draw.line([(10, 45), (self.width - 10, 45)], fill=self.WHITE, width=2)
-                
-                # 說明標題
-                draw.text((10, 55), "📋 操作說明:", fill=self.CYAN, font=self.font_medium)
-                
-                # 遊戲說明內容
-                description = game.get('description', '暫無說明')
-                wrapped_lines = self._wrap_text(description, self.width - 20, self.font_medium)
-                
-                y_pos = 85
-                for line in wrapped_lines:
-                    if y_pos > self.height - 80:  # 防止文字超出螢幕
-                        break
-                    draw.text((10, y_pos), line, fill=self.WHITE, font=self.font_medium)
-                    y_pos += 25
-                
-                # 控制說明
-                control_y = self.height - 70
-                draw.text((10, control_y), "🎮 控制說明:", fill=self.CYAN, font=self.font_medium)
-                
-                controls = [
-                    "搖桿：移動/選擇",
-                    "A鈕：確認/行動", 
-                    "B鈕：取消/暫停"
-                ]
-                
-                for i, control in enumerate(controls):
-                    draw.text((10, control_y + 25 + i * 20), f"• {control}", 
-                             fill=self.GREEN, font=self.font_small)
-                
-                # 底部提示
-                self._draw_centered_text(
-                    draw, "A:開始遊戲 B:返回選單", 
-                    self.height - 15, 
-                    self.font_small, 
-                    self.WHITE
-                )
-                
+            image, draw = self._begin(self._tmpl_instructions)
+            
+            # 遊戲名稱
+            game_name = game.name
+            self._draw_centered_text(draw, game_name, 10, self.font_large, self.YELLOW)
+            
+            # 遊戲說明內容
+            description = game.description or '暫無說明'
+            wrapped_lines = self._wrap_text(description, self.width - 20, self.font_medium)
+            
+            y_pos = 85
+            max_y = self.height - 80  # 防止文字超出螢幕
+            draw_text = self._draw_text
+            font_medium = self.font_medium
+            for line in wrapped_lines:
+                if y_pos > max_y:
+                    break
+                draw_text(draw, (10, y_pos), line, font_medium, self.WHITE)
+                y_pos += 25
+            
+            self._present(image)
+            
         except Exception as e:
             print(f"顯示遊戲說明失敗: {e}")
     
@@ -357,49 +664,37 @@ class SPIScreenManager:
             return
         
         try:
-            with canvas(self.device) as draw:
-                # 黑色背景
-                draw.rectangle(self.device.bounding_box, outline=self.BLACK, fill=self.BLACK)
-                
-                # 遊戲結束標題
-                title_text = "🎯 遊戲結束"
-                self._draw_centered_text(draw, title_text, 50, self.font_large, self.RED)
-                
-                # 分數顯示
-                score_text = f"本次分數: {score}"
-                self._draw_centered_text(draw, score_text, 120, self.font_large, self.YELLOW)
-                
-                # 最高分數（如果有）
-                if high_score is not None:
-                    if score > high_score:
-                        record_text = "🏆 新紀錄！"
-                        record_color = self.GREEN
-                    else:
-                        record_text = f"最高分數: {high_score}"
-                        record_color = self.CYAN
-                    
-                    self._draw_centered_text(draw, record_text, 160, self.font_medium, record_color)
-                
-                # 評價
-                if score >= 1000:
-                    comment = "🌟 驚人表現！"
-                    comment_color = self.GREEN
-                elif score >= 500:
-                    comment = "⭐ 表現不錯！"
-                    comment_color = self.YELLOW
-                elif score >= 100:
-                    comment = "👍 繼續加油！"
-                    comment_color = self.CYAN
+            # 同樣的分數畫面已在螢幕上時不必重畫
+            key = ('game_over', score, high_score)
+            if key == self._shown_key:
+                return
+            
+            image, draw = self._begin(self._tmpl_gameover)
+            
+            # 分數顯示
+            score_text = f"本次分數: {score}"
+            self._draw_centered_text(draw, score_text, 120, self.font_large, self.YELLOW)
+            
+            # 最高分數（如果有）
+            if high_score is not None:
+                if score > high_score:
+                    record_text = NEW_RECORD_TEXT
+                    record_color = self.GREEN
                 else:
-                    comment = "💪 再接再厲！"
-                    comment_color = self.WHITE
-                
-                self._draw_centered_text(draw, comment, 200, self.font_medium, comment_color)
-                
-                # 底部提示
-                hint_text = "按任意鍵返回選單"
-                self._draw_centered_text(draw, hint_text, self.height - 30, self.font_small, self.WHITE)
+                    record_text = f"最高分數: {high_score}"
+                    record_color = self.CYAN
                 
+                self._draw_centered_text(draw, record_text, 160, self.font_medium, record_color)
+            
+            # 評價
+            for min_score, comment, comment_color in GAME_OVER_COMMENTS:
+                if min_score is None or score >= min_score:
+                    break
+            
+            self._draw_centered_text(draw, comment, 200, self.font_medium, comment_color)
+            
+            self._present(image, key)
+            
         except Exception as e:
             print(f"顯示遊戲結束畫面失敗: {e}")
     
@@ -414,16 +709,14 @@ class SPIScreenManager:
             message_color = self.WHITE
         
         try:
-            with canvas(self.device) as draw:
-                # 黑色背景
-                draw.rectangle(self.device.bounding_box, outline=self.BLACK, fill=self.BLACK)
+            # 同樣的訊息已在螢幕上時不必重畫，但仍依 duration 停留後清除
+            key = ('message', title, message, title_color, message_color)
+            if key != self._shown_key:
+                image, draw = self._begin(self._tmpl_message)
                 
                 # 標題
                 self._draw_centered_text(draw, title, 50, self.font_large, title_color)
                 
-                # 分隔線
-                draw.line([(20, 90), (self.width - 20, 90)], fill=self.WHITE, width=2)
-                
                 # 訊息內容
                 wrapped_lines = self._wrap_text(message, self.width - 20, self.font_medium)
                 
@@ -431,9 +724,13 @@ class SPIScreenManager:
                 total_height = len(wrapped_lines) * 25
                 current_y = start_y + (self.height - start_y - total_height) // 2
                 
+                draw_centered_text = self._draw_centered_text
+                font_medium = self.font_medium
                 for line in wrapped_lines:
-                    self._draw_centered_text(draw, line, current_y, self.font_medium, message_color)
+                    draw_centered_text(draw, line, current_y, font_medium, message_color)
                     current_y += 25
+                
+                self._present(image, key)
             
             if duration > 0:
                 time.sleep(duration)
@@ -448,106 +745,267 @@ class SPIScreenManager:
             return
         
         try:
-            with canvas(self.device) as draw:
-                # 黑色背景
-                draw.rectangle(self.device.bounding_box, outline=self.BLACK, fill=self.BLACK)
+            if progress is None:
+                # 簡單的載入動畫點，點數未變時畫面相同不必重畫
+                dots = "." * ((int(time.time() * 2) % 4))
+                key = ('loading', message, dots)
+                if key == self._shown_key:
+                    return
+                
+                # 訊息底圖依訊息快取，動畫更新只需畫上載入點
+                if self._loading_bg is None or self._loading_bg[0] != message:
+                    background = self._tmpl_loading.copy()
+                    self._draw_centered_text(ImageDraw.Draw(background), message, 100, self.font_large, self.CYAN)
+                    self._loading_bg = (message, background)
+                
+                image, draw = self._begin(self._loading_bg[1])
+                self._draw_centered_text(draw, f"載入中{dots}", 150, self.font_medium, self.WHITE)
+            else:
+                key = ('loading', message, progress)
+                if key == self._shown_key:
+                    return
+                
+                # 有進度值時使用含進度條框架的底圖
+                image, draw = self._begin(self._tmpl_progress)
                 
                 # 載入訊息
                 self._draw_centered_text(draw, message, 100, self.font_large, self.CYAN)
                 
-                # 進度條（如果有進度值）
-                if progress is not None:
-                    bar_width = self.width - 40
-                    bar_height = 20
-                    bar_x = 20
-                    bar_y = 150
-                    
-                    # 進度條框架
+                bar_width = self.width - 40
+                bar_height = 20
+                bar_x = 20
+                bar_y = 150
+                
+                # 進度填充
+                if progress > 0:
+                    fill_width = int(bar_width * progress / 100)
                     draw.rectangle(
-                        [(bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height)],
-                        outline=self.WHITE,
-                        fill=self.BLACK
+                        [(bar_x + 2, bar_y + 2), (bar_x + fill_width - 2, bar_y + bar_height - 2)],
+                        fill=self.GREEN
                     )
-                    
-                    # 進度填充
-                    if progress > 0:
-                        fill_width = int(bar_width * progress / 100)
-                        draw.rectangle(
-                            [(bar_x + 2, bar_y + 2), (bar_x + fill_width - 2, bar_y + bar_height - 2)],
-                            fill=self.GREEN
-                        )
-                    
-                    # 進度百分比
-                    percent_text = f"{progress}%"
-                    self._draw_centered_text(draw, percent_text, bar_y + 30, self.font_medium, self.WHITE)
-                else:
-                    # 簡單的載入動畫點
-                    dots = "." * ((int(time.time() * 2) % 4))
-                    dots_text = f"載入中{dots}"
-                    self._draw_centered_text(draw, dots_text, 150, self.font_medium, self.WHITE)
                 
+                # 進度百分比
+                percent_text = f"{progress}%"
+                self._draw_centered_text(draw, percent_text, bar_y + 30, self.font_medium, self.WHITE)
+            
+            # 只有載入點或進度所在的區域會被傳送
+            self._present(image, key)
+            
         except Exception as e:
             print(f"顯示載入畫面失敗: {e}")
     
+    def _begin(self, template=None, color=None):
+        """
+        取得用來繪製下一畫面的常駐緩衝區，不另外配置新影像
+        
+        參數:
+            template: 要先貼上的底圖，None 時以 color 填滿
+            color: 填滿顏色，預設黑色
+        
+        返回:
+            (緩衝區影像, 對應的 ImageDraw)
+        """
+        image = self._frames[self._back]
+        draw = self._frame_draws[self._back]
+        if template is not None:
+            image.paste(template)
+        else:
+            # paste 以整塊填值清除，比 draw.rectangle 逐列繪製快約四倍
+            image.paste(color or self.BLACK, (0, 0, self.width, self.height))
+        return image, draw
+    
+    def _present(self, image, key=None, fill=None):
+        """
+        將畫面送到螢幕，只傳送與目前螢幕內容不同的矩形區域
+        
+        參數:
+            image: 完整畫面 (RGB)，送出後直到下次送出前不可再修改
+            key: 畫面內容識別鍵，供呼叫端跳過相同內容的重繪
+            fill: 整個畫面為單一顏色時傳入該顏色，直接送出重複的像素值而不裁切轉換
+        """
+        assert image.mode == COMPOSE_MODE, f"畫面模式應為 {COMPOSE_MODE}，實際為 {image.mode}"
+        if self._shown_image is None:
+            boxes = [(0, 0, self.width, self.height)]
+        else:
+            diff = ImageChops.difference(image, self._shown_image)
+            box = diff.getbbox()
+            boxes = self._dirty_bands(diff, box) if box is not None else []
+        
+        if boxes:
+            # 裁切出的區域是獨立的影像，緩衝區之後被改寫也不影響傳送
+            if fill is None:
+                regions = [(box, image.crop(box)) for box in boxes]
+            else:
+                frame = self._fill_frame(fill)
+                bpp = len(frame) // (self.width * self.height)
+                regions = [(box, frame[:(box[2] - box[0]) * (box[3] - box[1]) * bpp]) for box in boxes]
+            if self._flush_thread is not None and self._flush_thread.is_alive():
+                self._flush_queue.put(regions)
+            else:
+                for box, region in regions:
+                    self._write_region(box, region)
+        self._shown_image = image
+        self._shown_key = key
+        # 送出的緩衝區成為螢幕畫面，下一畫面改用另一個緩衝區
+        if image is self._frames[self._back]:
+            self._back ^= 1
+    
+    @staticmethod
+    def _dirty_bands(diff, box):
+        """
+        將變更範圍依列拆成數個矩形，例如選單反白從第一項移到最後一項時，
+        中間未變的項目不必重送
+        
+        參數:
+            diff: 新舊畫面的差異影像
+            box: 差異影像的整體邊界
+        
+        返回:
+            需要傳送的矩形列表
+        """
+        if not NUMPY_AVAILABLE:
+            return [box]
+        
+        left, top, right, bottom = box
+        rows = np.flatnonzero(np.asarray(diff.crop(box)).any(axis=(1, 2)))
+        splits = np.flatnonzero(np.diff(rows) > DIRTY_BAND_GAP)
+        if not len(splits):
+            return [box]
+        
+        bands = []
+        start = 0
+        for end in list(splits + 1) + [len(rows)]:
+            band = (left, top + int(rows[start]), right, top + int(rows[end - 1]) + 1)
+            band_left, _, band_right, _ = diff.crop(band).getbbox()
+            bands.append((left + band_left, band[1], left + band_right, band[3]))
+            start = end
+        return bands
+    
+    def _fill_frame(self, color):
+        """整個畫面填滿單一顏色的像素資料（依顏色快取，以 memoryview 切片避免複製）"""
+        frame = self._fill_cache.get(color)
+        if frame is None:
+            frame = memoryview(self._pixel_bytes(color) * (self.width * self.height))
+            self._fill_cache[color] = frame
+        return frame
+    
+    @staticmethod
+    def _pixel_bytes(color):
+        """單一像素在目前色彩格式下的位元組（RGB565 或 18 位元的 RGB888）"""
+        r, g, b = (ImageColor.getrgb(color) if isinstance(color, str) else color)[:3]
+        if NUMPY_AVAILABLE:
+            value = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+            return bytes((value >> 8, value & 0xFF))
+        return bytes((r, g, b))
+    
+    def _write_region(self, box, region):
+        """設定 ILI9341 的寫入視窗並傳送該矩形的像素（影像或已編碼的位元組）"""
+        left, top, right, bottom = box
+        self.device.command(ILI9341_CASET, left >> 8, left & 0xFF, (right - 1) >> 8, (right - 1) & 0xFF)
+        self.device.command(ILI9341_PASET, top >> 8, top & 0xFF, (bottom - 1) >> 8, (bottom - 1) & 0xFF)
+        self.device.command(ILI9341_RAMWR)
+        if isinstance(region, (bytes, memoryview)):
+            data = region
+        else:
+            data = self._to_rgb565(region) if NUMPY_AVAILABLE else region.tobytes()
+        self.device.data(data)
+    
+    def _to_rgb565(self, image):
+        """將 RGB888 影像轉為大端序 RGB565 位元組（有 Numba 時使用編譯過的迴圈）"""
+        if NUMBA_AVAILABLE:
+            width, height = image.size
+            out = self._pack_out[:width * height * 2].reshape(height, width * 2)
+            _pack_rgb565(np.asarray(image), out)
+            return out.tobytes()
+        
+        rgb = np.asarray(image, dtype=np.uint16)
+        rgb565 = ((rgb[:, :, 0] & 0xF8) << 8) | ((rgb[:, :, 1] & 0xFC) << 3) | (rgb[:, :, 2] >> 3)
+        return rgb565.astype('>u2').tobytes()
+    
     def _draw_centered_text(self, draw, text, y, font, color):
         """繪製置中文字"""
-        try:
-            text_bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = text_bbox[2] - text_bbox[0]
-        except AttributeError:
-            text_width, _ = draw.textsize(text, font=font)
-        
-        x = (self.width - text_width) // 2
-        draw.text((x, y), text, fill=color, font=font)
+        x = (self.width - _text_width(font, text)) // 2
+        self._draw_text(draw, (x, y), text, font, color)
+    
+    @staticmethod
+    def _draw_text(draw, xy, text, font, color):
+        """以快取的文字遮罩繪製文字，結果與 draw.text 相同"""
+        mask, (left, top) = _text_mask(font, text)
+        draw.bitmap((xy[0] + left, xy[1] + top), mask, fill=color)
     
     def _wrap_text(self, text, max_width, font):
-        """自動換行文字"""
+        """自動換行文字（結果依文字、寬度與字體快取）"""
         if not text:
             return []
         
-        lines = []
-        words = text.split(' ')
-        current_line = ""
+        cache_key = (text, max_width, font)
+        cached = self._wrap_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            
-            try:
-                bbox = font.getbbox(test_line)
-                line_width = bbox[2] - bbox[0]
-            except AttributeError:
-                try:
-                    line_width, _ = font.getsize(test_line)
-                except:
-                    lines.append(test_line)
-                    current_line = ""
-                    continue
-            
-            if line_width <= max_width:
-                current_line = test_line
+        tokens = _WRAP_TOKEN_RE.findall(text)
+        try:
+            # 每個單位只量測一次，以累計的前進寬度決定換行
+            metrics = [_word_metrics(font, token) for token in tokens]
+        except Exception:
+            # 無法量測時每個單字各佔一行
+            lines = [token for token in tokens if not token.isspace()]
+            self._wrap_cache[cache_key] = lines
+            return lines
+        
+        # 整行寬度 = 行首到末字前的前進寬度 + 末字右緣 - 首字左緣；
+        # 空白只在後面接著文字時才佔寬度，行首與行尾的空白不保留
+        lines = []
+        line_tokens = []
+        line_advance = 0
+        line_left = 0
+        for token, (left, right, advance) in zip(tokens, metrics):
+            if token.isspace():
+                if line_tokens:
+                    line_tokens.append(token)
+                    line_advance += advance
+            elif not line_tokens:
+                line_tokens.append(token)
+                line_advance = advance
+                line_left = left
+            elif line_advance + right - line_left <= max_width:
+                line_tokens.append(token)
+                line_advance += advance
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+                lines.append("".join(line_tokens).rstrip())
+                line_tokens = [token]
+                line_advance = advance
+                line_left = left
         
-        if current_line:
-            lines.append(current_line)
+        if line_tokens:
+            lines.append("".join(line_tokens).rstrip())
         
+        self._wrap_cache[cache_key] = lines
         return lines
     
     def set_brightness(self, brightness):
         """設定螢幕亮度 (0-100)"""
         try:
             if 0 <= brightness <= 100:
-                # 使用PWM控制背光亮度
-                pwm = GPIO.PWM(self.SPI_LED, 1000)  # 1kHz頻率
-                pwm.start(brightness)
+                # 使用PWM控制背光亮度（GPIO 27 不支援硬體PWM，沿用同一個軟體PWM）
+                if self._pwm is None:
+                    self._pwm = GPIO.PWM(self.SPI_LED, 1000)  # 1kHz頻率
+                    self._pwm.start(brightness)
+                else:
+                    self._pwm.ChangeDutyCycle(brightness)
                 print(f"螢幕亮度設定為: {brightness}%")
             else:
                 print("亮度值必須在0-100之間")
         except Exception as e:
             print(f"設定亮度失敗: {e}")
     
+    def set_idle(self, idle):
+        """閒置時調暗背光、恢復操作時全亮，狀態未改變時不動作"""
+        if idle == self._idle:
+            return
+        self._idle = idle
+        self.set_brightness(IDLE_BRIGHTNESS if idle else 100)
+    
     def get_status(self):
         """獲取螢幕狀態"""
         return {
@@ -563,9 +1021,13 @@ class SPIScreenManager:
         try:
             if self.device:
                 self.clear_screen()
+                self._stop_flush_thread()
                 print("✓ TFT螢幕已清理")
             
-            # 關閉背光
+            # 停止背光PWM並關閉背光
+            if self._pwm is not None:
+                self._pwm.stop()
+                self._pwm = None
             if hasattr(self, 'SPI_LED') and self.SPI_LED is not None:
                 GPIO.output(self.SPI_LED, GPIO.LOW)
                 print("✓ 背光已關閉")
@@ -586,23 +1048,24 @@ def run_screen_test():
         GPIO.setwarnings(False)
         
         # 初始化螢幕
-        screen = SPIScreenManager()
+        screen = SPIScreenManager(splash_duration=1)
         
         if not screen.device:
             print("❌ 螢幕初始化失敗，測試終止")
             return
         
         # 測試資料
+        GameInfo = namedtuple('GameInfo', ['id', 'name', 'description'])
         games_data = [
-            {"id": 1, "name": "貪吃蛇", "description": "使用搖桿控制蛇的移動方向，吃到食物會變長。按A鈕可以加速移動。"},
-            {"id": 2, "name": "打磚塊", "description": "使用搖桿左右移動擋板，按A鈕發射球。打破所有磚塊即可過關。"},
-            {"id": 3, "name": "太空侵略者", "description": "使用搖桿左右移動太空船，按A鈕發射子彈消滅入侵的外星人。"},
-            {"id": 4, "name": "井字遊戲", "description": "經典的圈圈叉叉遊戲。使用搖桿選擇格子，按A鈕確認下棋。"},
-            {"id": 5, "name": "記憶翻牌", "description": "翻開相同的牌配對。使用搖桿選擇牌，按A鈕翻牌。"},
-            {"id": 6, "name": "簡易迷宮", "description": "使用搖桿控制角色在迷宮中移動，找到出口即可過關。"},
-            {"id": 7, "name": "打地鼠", "description": "地鼠會隨機出現，使用搖桿移動槌子，按A鈕敲擊地鼠得分。"},
-            {"id": 8, "name": "俄羅斯方塊", "description": "經典方塊遊戲。搖桿左右移動，上改變方向，下加速。按A鈕快速落下。"},
-            {"id": 9, "name": "反應力測試", "description": "當螢幕出現信號時，盡快按A鈕。測試你的反應速度。"}
+            GameInfo(1, "貪吃蛇", "使用搖桿控制蛇的移動方向，吃到食物會變長。按A鈕可以加速移動。"),
+            GameInfo(2, "打磚塊", "使用搖桿左右移動擋板，按A鈕發射球。打破所有磚塊即可過關。"),
+            GameInfo(3, "太空侵略者", "使用搖桿左右移動太空船，按A鈕發射子彈消滅入侵的外星人。"),
+            GameInfo(4, "井字遊戲", "經典的圈圈叉叉遊戲。使用搖桿選擇格子，按A鈕確認下棋。"),
+            GameInfo(5, "記憶翻牌", "翻開相同的牌配對。使用搖桿選擇牌，按A鈕翻牌。"),
+            GameInfo(6, "簡易迷宮", "使用搖桿控制角色在迷宮中移動，找到出口即可過關。"),
+            GameInfo(7, "打地鼠", "地鼠會隨機出現，使用搖桿移動槌子，按A鈕敲擊地鼠得分。"),
+            GameInfo(8, "俄羅斯方塊", "經典方塊遊戲。搖桿左右移動，上改變方向，下加速。按A鈕快速落下。"),
+            GameInfo(9, "反應力測試", "當螢幕出現信號時，盡快按A鈕。測試你的反應速度。")
         ]
         
         print("✅ 螢幕初始化成功，開始測試...")
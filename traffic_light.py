@@ -8,39 +8,46 @@ class TrafficLight:
         self.yellow_pin = yellow_pin
         self.green_pin = green_pin
         self.pins = [self.red_pin, self.yellow_pin, self.green_pin]
+        self._pin_map = {
+            "red": self.red_pin,
+            "yellow": self.yellow_pin,
+            "green": self.green_pin
+        }
+        # 各燈號對應三個腳位 (紅, 黃, 綠) 的輸出，一次呼叫寫入全部腳位
+        self._patterns = {
+            "red": [GPIO.HIGH, GPIO.LOW, GPIO.LOW],
+            "yellow": [GPIO.LOW, GPIO.HIGH, GPIO.LOW],
+            "green": [GPIO.LOW, GPIO.LOW, GPIO.HIGH],
+            "off": [GPIO.LOW, GPIO.LOW, GPIO.LOW]
+        }
         self._setup()
 
     def _setup(self):
         # GPIO.setmode(GPIO.BCM) # 假設 main.py 中已設定
-        for pin in self.pins:
-            GPIO.setup(pin, GPIO.OUT)
-            GPIO.output(pin, GPIO.LOW) # 預設全滅
+        GPIO.setup(self.pins, GPIO.OUT)
+        GPIO.output(self.pins, GPIO.LOW) # 預設全滅
 
     def set_light(self, color, state):
         """設定特定顏色的燈的狀態"""
-        pin_map = {
-            "red": self.red_pin,
-            "yellow": self.yellow_pin,
-            "green": self.green_pin
-        }
-        if color in pin_map:
-            GPIO.output(pin_map[color], GPIO.HIGH if state else GPIO.LOW)
+        pin = self._pin_map.get(color)
+        if pin is not None:
+            GPIO.output(pin, GPIO.HIGH if state else GPIO.LOW)
+
+    def show(self, color):
+        """只亮指定顏色的燈（"off" 為全滅），三個腳位在同一次呼叫中設定"""
+        GPIO.output(self.pins, self._patterns[color])
 
     def all_off(self):
-        for pin in self.pins:
-            GPIO.output(pin, GPIO.LOW)
+        self.show("off")
 
     def red_on(self):
-        self.all_off()
-        self.set_light("red", True)
+        self.show("red")
 
     def yellow_on(self):
-        self.all_off()
-        self.set_light("yellow", True)
+        self.show("yellow")
 
     def green_on(self):
-        self.all_off()
-        self.set_light("green", True)
+        self.show("green")
 
     def cleanup(self):
         self.all_off()